@@ -2,16 +2,24 @@
 Async Neo4j connection management for FastAPI.
 
 Provides async Neo4j driver initialization and session dependency injection
-for FastAPI routes. The driver is initialized once at module load and reused
-across all requests for optimal performance.
+for FastAPI routes. The driver is created lazily on first use (or during the
+application lifespan) and reused across all requests, so importing this
+module performs no DNS resolution or socket setup.
 
-The session dependency handles automatic resource cleanup via async context
-manager pattern, ensuring connections are properly returned to the pool.
+Read sessions are opened once and shared through a bounded queue. Each
+request checks a session out exclusively and returns it when the request
+completes, avoiding per-request session construction and teardown. A request
+that cannot check a session out within the connection acquisition timeout
+fails with 503, and a session used by a failed request is replaced rather
+than reused.
 
 Environment Variables (from config):
     NEO4J_URI: Neo4j bolt connection URI (e.g., bolt://localhost:7687)
     NEO4J_USER: Neo4j username for authentication
     NEO4J_PASSWORD: Neo4j password for authentication
+    NEO4J_SESSION_POOL_SIZE: Number of pre-opened read sessions
+    NEO4J_MAX_CONNECTION_POOL_SIZE: Driver connection pool limit
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT: Seconds to wait for a pooled connection
 
 Example Usage:
     ```python
@@ -37,7 +45,8 @@ Example Usage:
 import asyncio
 from typing import AsyncIterator
 
-from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncSession
+from fastapi import HTTPException, status
+from neo4j import READ_ACCESS, AsyncDriver, AsyncGraphDatabase, AsyncSession
 
 from ..config import settings
 from ..utils.logging import get_logger
@@ -47,6 +56,9 @@ logger = get_logger(__name__)
 _driver: AsyncDriver | None = None
 _driver_lock = asyncio.Lock()
 
+_session_pool: asyncio.Queue[AsyncSession] | None = None
+_session_pool_lock = asyncio.Lock()
+
 
 async def init_driver(max_attempts: int = 3, initial_delay: float = 0.5) -> AsyncDriver:
     """Initialise the Neo4j driver with simple retry semantics."""
@@ -67,6 +79,8 @@ async def init_driver(max_attempts: int = 3, initial_delay: float = 0.5) -> Asyn
                 candidate = AsyncGraphDatabase.driver(
                     settings.NEO4J_URI,
                     auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+                    max_connection_pool_size=settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+                    connection_acquisition_timeout=settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
                 )
                 await candidate.verify_connectivity()
             except Exception as exc:  # noqa: BLE001
@@ -92,10 +106,44 @@ async def init_driver(max_attempts: int = 3, initial_delay: float = 0.5) -> Asyn
         raise RuntimeError(message)
 
 
+async def init_session_pool(size: int | None = None) -> asyncio.Queue[AsyncSession]:
+    """Open the shared pool of read sessions, creating the driver if needed."""
+
+    global _session_pool
+    if _session_pool is not None:
+        return _session_pool
+
+    async with _session_pool_lock:
+        if _session_pool is not None:
+            return _session_pool
+
+        driver = await init_driver()
+        pool_size = size or settings.NEO4J_SESSION_POOL_SIZE
+        pool: asyncio.Queue[AsyncSession] = asyncio.Queue(maxsize=pool_size)
+        for _ in range(pool_size):
+            pool.put_nowait(driver.session(default_access_mode=READ_ACCESS))
+        _session_pool = pool
+        return pool
+
+
+async def _close_session_pool() -> None:
+    global _session_pool
+    if _session_pool is None:
+        return
+    pool, _session_pool = _session_pool, None
+    while not pool.empty():
+        session = pool.get_nowait()
+        try:
+            await session.close()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("neo4j_session_close_failed", extra={"error": str(exc)})
+
+
 async def close_driver() -> None:
-    """Close the Neo4j driver if it was initialised."""
+    """Close pooled sessions and the Neo4j driver if it was initialised."""
 
     global _driver
+    await _close_session_pool()
     if _driver is None:
         return
     await _driver.close()
@@ -103,8 +151,51 @@ async def close_driver() -> None:
 
 
 async def get_neo4j_session() -> AsyncIterator[AsyncSession]:
-    """FastAPI dependency that yields an active Neo4j session."""
-
-    driver = await init_driver()
-    async with driver.session() as session:
+    """FastAPI dependency that yields a pooled Neo4j read session.
+
+    The session is held exclusively for the duration of the request and
+    returned to the pool afterwards. When all sessions are checked out the
+    request waits up to ``NEO4J_CONNECTION_ACQUISITION_TIMEOUT`` seconds and
+    then fails with 503. If the request fails with anything other than an
+    ``HTTPException``, its session is closed and a fresh one takes its place
+    in the pool.
+
+    Raises:
+        HTTPException: 503 when no pooled session frees up in time.
+    """
+
+    pool = await init_session_pool()
+    try:
+        session = await asyncio.wait_for(
+            pool.get(), settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT
+        )
+    except asyncio.TimeoutError as exc:
+        logger.warning("neo4j_session_pool_exhausted", extra={"size": pool.maxsize})
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Graph database is busy, retry shortly",
+        ) from exc
+
+    try:
         yield session
+    except HTTPException:
+        # Deliberate error responses (e.g. 404) leave the session healthy
+        pool.put_nowait(session)
+        raise
+    except BaseException:
+        await _replace_session(pool, session)
+        raise
+    else:
+        pool.put_nowait(session)
+
+
+async def _replace_session(pool: asyncio.Queue[AsyncSession], session: AsyncSession) -> None:
+    """Close a session left in an unknown state and pool a fresh one in its place."""
+
+    try:
+        await session.close()
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("neo4j_session_close_failed", extra={"error": str(exc)})
+    # Skip the refill once close_driver has torn the pool down
+    if pool is _session_pool and _driver is not None:
+        pool.put_nowait(_driver.session(default_access_mode=READ_ACCESS))
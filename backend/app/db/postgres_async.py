@@ -9,7 +9,8 @@ across all requests for optimal performance.
 """
 
 import asyncpg
-from typing import AsyncIterator, Optional
+import orjson
+from typing import Any, AsyncIterator, Optional
 from ..config import settings
 
 
@@ -44,12 +45,19 @@ DSN = _normalize_dsn(settings.DATABASE_URL)
 _pool: Optional[asyncpg.Pool] = None
 
 
+def _encode_json(value: Any) -> str:
+    """Encode a Python value for a json/jsonb parameter."""
+    return orjson.dumps(value).decode("utf-8")
+
+
 async def _init_conn(conn: asyncpg.Connection) -> None:
     """
     Initialize a new connection with application-specific settings.
 
     Called automatically for each new connection in the pool.
-    Sets timeouts and optional pgvector/pgvectorscale query parameters.
+    Sets timeouts and optional pgvector/pgvectorscale query parameters, and
+    registers orjson codecs so json/jsonb columns round-trip as Python
+    dicts and lists (asyncpg otherwise returns and expects raw strings).
 
     Args:
         conn: New asyncpg connection to initialize
@@ -65,9 +73,18 @@ async def _init_conn(conn: asyncpg.Connection) -> None:
         -- SET ivfflat.probes = 8;
         """
     )
+    for typename in ("json", "jsonb"):
+        await conn.set_type_codec(
+            typename,
+            schema="pg_catalog",
+            encoder=_encode_json,
+            decoder=orjson.loads,
+        )
 
 
-async def init_pool(min_size: int = 1, max_size: int = 16) -> asyncpg.Pool:
+async def init_pool(
+    min_size: Optional[int] = None, max_size: Optional[int] = None
+) -> asyncpg.Pool:
     """
     Initialize the global asyncpg connection pool.
 
@@ -76,7 +93,9 @@ async def init_pool(min_size: int = 1, max_size: int = 16) -> asyncpg.Pool:
 
     Args:
         min_size: Minimum number of connections to maintain in pool
+            (defaults to ``settings.PG_POOL_MIN_SIZE``)
         max_size: Maximum number of connections allowed in pool
+            (defaults to ``settings.PG_POOL_MAX_SIZE``)
 
     Returns:
         Initialized asyncpg connection pool
@@ -89,11 +108,12 @@ async def init_pool(min_size: int = 1, max_size: int = 16) -> asyncpg.Pool:
     if _pool is None:
         _pool = await asyncpg.create_pool(
             dsn=DSN,
-            min_size=min_size,
-            max_size=max_size,
+            min_size=settings.PG_POOL_MIN_SIZE if min_size is None else min_size,
+            max_size=settings.PG_POOL_MAX_SIZE if max_size is None else max_size,
             max_inactive_connection_lifetime=60,  # Close idle connections after 60s
             init=_init_conn,
             statement_cache_size=1024,  # Cache prepared statements
+            max_cached_statement_lifetime=0,  # Keep them for the connection's life
         )
 
     return _pool
@@ -136,3 +156,26 @@ async def get_pg() -> AsyncIterator[asyncpg.Connection]:
 
     async with pool.acquire() as conn:
         yield conn
+
+
+async def get_pg_pool() -> asyncpg.Pool:
+    """
+    FastAPI dependency returning the shared connection pool itself.
+
+    Use this instead of :func:`get_pg` when a route issues independent
+    queries concurrently: ``Pool.fetch``/``fetchrow`` check out a separate
+    connection per call, whereas a single connection runs one query at a
+    time.
+
+    Raises:
+        RuntimeError: If connection pool has not been initialized
+    """
+    pool = await init_pool()
+
+    if pool is None:
+        raise RuntimeError(
+            "PostgreSQL connection pool not initialized. "
+            "Call init_pool() in application lifespan."
+        )
+
+    return pool
@@ -2,22 +2,31 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
-
 from ..config import settings
 from ..utils.cache import CacheManager
 
+_cache_manager: CacheManager | None = None
+
 
-@lru_cache(maxsize=1)
 def get_cache_manager() -> CacheManager:
     """Return a singleton CacheManager configured from settings."""
 
-    return CacheManager(
-        redis_url=settings.REDIS_URL,
-        default_ttl=settings.CACHE_TTL_SECONDS,
-        max_items=settings.CACHE_MAX_ITEMS,
-        namespace=settings.CACHE_NAMESPACE,
-    )
+    global _cache_manager
+    if _cache_manager is None:
+        _cache_manager = CacheManager(
+            redis_url=settings.REDIS_URL,
+            default_ttl=settings.CACHE_TTL_SECONDS,
+            max_items=settings.CACHE_MAX_ITEMS,
+            namespace=settings.CACHE_NAMESPACE,
+        )
+    return _cache_manager
+
+
+def reset_cache_manager() -> None:
+    """Drop the singleton so the next lookup picks up current settings."""
+
+    global _cache_manager
+    _cache_manager = None
 
 
 cache_manager = get_cache_manager
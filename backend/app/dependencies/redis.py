@@ -4,13 +4,23 @@ from __future__ import annotations
 
 from typing import Optional
 
+from fastapi import Request
 from redis.asyncio import Redis
 
 from ..config import settings
 from ..utils.redis import get_redis_client
 
 
-async def get_redis() -> Optional[Redis]:
-    """Return a Redis client instance or ``None`` when unavailable."""
+async def get_redis(request: Request) -> Optional[Redis]:
+    """Return the Redis client connected during startup or ``None`` when unavailable.
 
-    return await get_redis_client(settings.REDIS_URL)
+    The client resolved in the application lifespan is served from
+    ``app.state.redis``. When Redis was down at startup the connection is
+    retried on each call and stored once it succeeds.
+    """
+
+    client = getattr(request.app.state, "redis", None)
+    if client is None:
+        client = await get_redis_client(settings.REDIS_URL)
+        request.app.state.redis = client
+    return client
@@ -20,7 +20,13 @@ async def get_retrieval_orchestrator(
     conn: asyncpg.Connection = Depends(get_pg),
     session: AsyncSession = Depends(get_neo4j_session),
 ) -> RetrievalOrchestrator:
-    """Provide a retrieval orchestrator composed of search and graph services."""
+    """Provide a retrieval orchestrator composed of search and graph services.
+
+    The services wrap the request-scoped connection and session, so they are
+    built per request; they are slotted to keep that allocation cheap. The
+    fusion strategy is memoised per manifest generation by
+    :func:`resolve_fusion_strategy`.
+    """
 
     search_service = SearchApiService(conn)
     graph_service = GraphExpansionService(session)
@@ -38,7 +38,7 @@ from typing import AsyncIterator, Dict
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from .config import settings
 from .dependencies.cache import get_cache_manager
@@ -61,8 +61,8 @@ from .routers import (
     verses,
 )
 from .db.postgres_async import init_pool
-from .utils.redis import close_redis
-from .db.neo4j import close_driver, init_driver
+from .utils.redis import close_redis, get_redis_client
+from .db.neo4j import close_driver, init_session_pool
 from .utils.logging import configure_logging
 from .utils.observability import configure_tracing
 
@@ -74,8 +74,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     Handles initialization and cleanup of shared resources:
         - PostgreSQL connection pool (asyncpg)
-        - Redis connection (via cache manager)
-        - Neo4j driver (graph database)
+        - Redis connection (exposed on ``app.state.redis``)
+        - Neo4j driver and pooled read sessions (graph database)
         - Cache manager initialization
         - Close Neo4j driver explicitly
 
@@ -86,10 +86,11 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         None (context manager pattern for startup/shutdown)
     """
     # Startup: Initialize connection pools
-    await init_pool(min_size=1, max_size=16)
+    await init_pool()
+    app.state.redis = await get_redis_client(settings.REDIS_URL)
     cache = get_cache_manager()
 
-    await init_driver()
+    await init_session_pool()
 
     try:
         # Application is running, yield control
@@ -99,6 +100,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         await close_driver()
         await cache.clear()
         await close_redis()
+        app.state.redis = None
 
 
 # FastAPI application instance
@@ -109,7 +111,7 @@ app = FastAPI(
     description="Biblical text exploration with graph and vector search",
     version="0.1.0",
     lifespan=lifespan,
-    default_response_class=JSONResponse,
+    default_response_class=ORJSONResponse,
 )
 
 tracer_provider = configure_tracing(
@@ -136,7 +138,8 @@ if tracer_provider is not None:
 # CORS middleware configuration
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.get_cors_origins_list(),
+    allow_origins=settings.cors_origins,
+    allow_origin_regex=settings.cors_origin_regex,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
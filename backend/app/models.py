@@ -1,6 +1,181 @@
+import base64
+import binascii
+import sys
+from array import array
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Literal
-from pydantic import BaseModel, Field, field_validator, model_validator
+from enum import IntEnum
+from functools import cache
+from typing import Annotated, Any, Dict, List, Optional, Literal
+from annotated_types import MaxLen, MinLen
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    PlainValidator,
+    StringConstraints,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+    create_model,
+    model_validator,
+)
+
+# Models used on cold paths (admin, analytics, asset management) build their
+# validators and serializers on first use rather than at import time.
+_DEFERRED = ConfigDict(defer_build=True)
+
+# Result rows are allocated in bulk and never mutated after construction;
+# updates go through ``model_copy``. Unknown fields are a bug in the caller.
+# Models using it are built from trusted database rows with
+# ``model_construct`` on the read path, so keep them free of validators.
+_HIT = ConfigDict(frozen=True, extra="forbid")
+
+# Result models on cold paths: the _HIT policy with a deferred build.
+_DEFERRED_HIT = ConfigDict(**_HIT, **_DEFERRED)
+
+
+def _decode_float32_embedding(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    """Decode a base64 float32 embedding into a list of floats.
+
+    Clients may send ``embedding`` either as a JSON array of numbers or as a
+    base64 string of little-endian float32 values. The packed form is decoded
+    in a single C-level pass and returned as-is: every element is already a
+    float, so the per-element ``List[float]`` check is skipped. Any other
+    input goes through regular list validation.
+    """
+
+    if isinstance(value, str):
+        try:
+            value = base64.b64decode(value, validate=True)
+        except binascii.Error as exc:
+            raise ValueError("embedding must be a list of floats or base64 float32") from exc
+    if isinstance(value, (bytes, bytearray)):
+        if len(value) % 4:
+            raise ValueError("embedding byte length must be a multiple of 4")
+        floats = array("f")
+        floats.frombytes(value)
+        if sys.byteorder != "little":
+            floats.byteswap()
+        return floats.tolist()
+    return handler(value)
+
+
+# Embedding vector field shared by every embedding-bearing model; accepts a
+# JSON array of numbers or a base64 float32 payload. Packed payloads bypass
+# list validation, so ``min_length``/``max_length`` set on the field only
+# hold for them on models that run :func:`_check_embedding_dim`.
+Embedding = Annotated[List[float], WrapValidator(_decode_float32_embedding)]
+
+
+_MAX_BATCH_IDS = 500
+
+
+def _fast_verse_id_list(value: Any, handler: ValidatorFunctionWrapHandler) -> List[str]:
+    """Skip per-item validation when the payload is already a bounded ``list[str]``.
+
+    Anything else falls through to the regular validator so constraint
+    errors are reported exactly as before.
+    """
+
+    if (
+        type(value) is list
+        and 0 < len(value) <= _MAX_BATCH_IDS
+        and all(type(item) is str for item in value)
+    ):
+        return value
+    return handler(value)
+
+
+def _opaque_json_object(value: Any) -> Any:
+    """Accept a JSON object (or None) without walking its keys and values."""
+
+    if value is None or isinstance(value, dict):
+        return value
+    raise ValueError("value must be a JSON object")
+
+
+# Free-form metadata passed through to storage untouched. A single isinstance
+# check replaces the per-key ``Dict[str, Any]`` validation; the schema is
+# unchanged.
+OpaqueJSON = Annotated[
+    Optional[Dict[str, Any]],
+    PlainValidator(_opaque_json_object, json_schema_input_type=Optional[Dict[str, Any]]),
+]
+
+
+# Text that must contain at least one non-whitespace character. Checked by a
+# pydantic-core pattern rather than a Python validator; the value is kept
+# verbatim (no stripping) so message bodies round-trip unchanged.
+NonEmptyStr = Annotated[str, StringConstraints(pattern=r"\S")]
+
+
+# Verse ID list shared by the batch, embedding lookup and asset link requests.
+VerseIdList = Annotated[List[str], WrapValidator(_fast_verse_id_list)]
+
+
+@cache
+def _embedding_length_bounds(model: type[BaseModel]) -> tuple[int, Optional[int]]:
+    """Return the ``min_length``/``max_length`` declared on a model's embedding field."""
+
+    low, high = 0, None
+    for constraint in model.model_fields["embedding"].metadata:
+        if isinstance(constraint, MinLen):
+            low = constraint.min_length
+        elif isinstance(constraint, MaxLen):
+            high = constraint.max_length
+    return low, high
+
+
+def _coerce_dim(dim: Any) -> Optional[int]:
+    """Read ``dim`` the way lax int validation will, or None if it cannot."""
+
+    if isinstance(dim, bool):
+        return None
+    if isinstance(dim, int):
+        return dim
+    if isinstance(dim, float):
+        return int(dim) if dim.is_integer() else None
+    if isinstance(dim, (str, bytes)):
+        try:
+            return int(dim)
+        except ValueError:
+            return None
+    return None
+
+
+def _check_embedding_dim(model: type[BaseModel], data: Any) -> Any:
+    """Reject a raw ``embedding`` payload whose length differs from ``dim``.
+
+    Runs before field validation and counts elements without validating or
+    decoding them: list length for JSON arrays, byte length / 4 for packed
+    float32 (base64 or bytes). The same count is held to the embedding
+    field's ``min_length``/``max_length``, which the packed fast path would
+    otherwise skip. Inputs in any other shape are passed on for field
+    validation to report. ``dim`` defaults to the model's declared
+    default and is read as lax int validation would (``"768"``, ``768.0``);
+    its own bounds are enforced by its field constraint.
+    """
+
+    if not isinstance(data, dict):
+        return data
+    value = data.get("embedding")
+    if isinstance(value, (list, tuple)):
+        length = len(value)
+    elif isinstance(value, (bytes, bytearray)):
+        length = len(value) // 4
+    elif isinstance(value, str):
+        length = (len(value) * 3 // 4 - value[-2:].count("=")) // 4
+    else:
+        return data
+    low, high = _embedding_length_bounds(model)
+    if length < low or (high is not None and length > high):
+        raise ValueError(f"embedding length {length} is outside [{low}, {high}]")
+    dim = _coerce_dim(data.get("dim", model.model_fields["dim"].default))
+    if dim is not None and length != dim:
+        raise ValueError(f"embedding length {length} does not match dim {dim}")
+    return data
+
 
 # ============================================================================
 # Domain Models - Core biblical text entities
@@ -21,22 +196,56 @@ class Verse(BaseModel):
 class VerseLite(BaseModel):
     """Lightweight verse record with minimal data."""
 
+    model_config = _HIT
+
     verse_id: str
     text: str
 
 
+class Testament(IntEnum):
+    """Testament classification, numbered like the ``labels[2]`` ANN filter."""
+
+    OLD = 1
+    NEW = 2
+
+
+def _parse_testament(value: Any) -> Any:
+    """Accept the ``"Old"``/``"New"`` names stored in the book table."""
+    if isinstance(value, str):
+        try:
+            return Testament[value.upper()]
+        except KeyError:
+            pass
+    return value
+
+
+TestamentField = Annotated[
+    Testament,
+    BeforeValidator(_parse_testament),
+    PlainSerializer(lambda t: t.name.title(), return_type=Literal["Old", "New"]),
+]
+
+
 class Book(BaseModel):
-    """Book metadata for a specific translation."""
+    """Book metadata for a specific translation.
+
+    ``testament`` is held as a :class:`Testament` but still serialises as
+    ``"Old"``/``"New"`` so the API contract is unchanged.
+    """
+
+    model_config = _DEFERRED
 
     translation_code: str
     book_number: int
     name: str
-    testament: Literal["Old", "New"]
+    testament: TestamentField
 
 
 class Chapter(BaseModel):
     """Chapter reference within a book and translation."""
 
+    model_config = _DEFERRED
+
     translation_code: str
     book_number: int
     chapter_number: int
@@ -45,11 +254,24 @@ class Chapter(BaseModel):
 class Translation(BaseModel):
     """Translation metadata."""
 
+    model_config = _DEFERRED
+
     translation_code: str
     language: Optional[str] = None
     format: Optional[str] = None
 
 
+class Rendition(BaseModel):
+    """Single verse rendition in a specific translation."""
+
+    model_config = _HIT
+
+    verse_id: str
+    translation: str
+    reference: str
+    text: str
+
+
 # ============================================================================
 # Search Models - Query and response schemas
 # ============================================================================
@@ -57,32 +279,33 @@ class Translation(BaseModel):
 class FTSQuery(BaseModel):
     """Full-text search query parameters."""
 
-    q: str
+    q: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
     translation: Optional[str] = None
     limit: int = Field(50, ge=1, le=500)
     offset: int = Field(0, ge=0)
 
-    @field_validator("q")
-    @classmethod
-    def validate_query(cls, value: str) -> str:
-        """Ensure the search query contains non-whitespace characters."""
-        if not value or not value.strip():
-            raise ValueError("Query must not be empty")
-        return value
 
+class _EmbeddingInput(BaseModel):
+    """Required query embedding with its model name and dimensionality.
 
-class VectorQuery(BaseModel):
-    """Semantic vector search query parameters."""
+    Subclasses may narrow ``embedding`` or ``dim`` with field constraints;
+    the length check against ``dim`` runs before any element is validated.
+    """
 
-    embedding: List[float]
+    embedding: Embedding
     model: str = "embeddinggemma"
     dim: int = 768
-    translation: Optional[str] = None
-    top_k: int = Field(50, ge=1, le=500)
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_embedding_length(cls, data: Any) -> Any:
+        """Reject a wrong-length embedding before its elements are validated."""
+
+        return _check_embedding_dim(cls, data)
 
     @model_validator(mode="after")
-    def validate_embedding_length(self) -> "VectorQuery":
-        """Ensure the embedding length matches the expected dimensionality."""
+    def validate_embedding_dim(self) -> "_EmbeddingInput":
+        """Catch any ``dim`` the pre-check could not read before coercion."""
 
         if len(self.embedding) != self.dim:
             raise ValueError(
@@ -91,11 +314,18 @@ class VectorQuery(BaseModel):
         return self
 
 
+class VectorQuery(_EmbeddingInput):
+    """Semantic vector search query parameters."""
+
+    translation: Optional[str] = None
+    top_k: int = Field(50, ge=1, le=500)
+
+
 class HybridQuery(BaseModel):
     """Hybrid search query combining FTS and vector search."""
 
     q: Optional[str] = None
-    embedding: Optional[List[float]] = None
+    embedding: Optional[Embedding] = None
     model: str = "embeddinggemma"
     dim: int = 768
     vector_k: int = Field(50, ge=1, le=500)
@@ -115,6 +345,8 @@ class RetrievalQuery(HybridQuery):
 class SearchHit(BaseModel):
     """Single search result with relevance score."""
 
+    model_config = _HIT
+
     verse_id: str
     text: str
     score: float
@@ -132,7 +364,7 @@ class GraphExpansion(BaseModel):
 
     verse_id: str
     cvk: Optional[str] = None
-    renditions: List["Rendition"] = Field(default_factory=list)
+    renditions: List[Rendition] = Field(default_factory=list)
 
 
 class GraphExpansionInfo(BaseModel):
@@ -157,6 +389,8 @@ class FusionInfo(BaseModel):
 class RetrievalHit(BaseModel):
     """Combined retrieval result with optional graph expansion."""
 
+    model_config = _HIT
+
     hit: SearchHit
     parallels: Optional[GraphExpansion] = None
 
@@ -173,18 +407,11 @@ class RetrievalResponse(BaseModel):
 # Graph Models - Cross-translation relationships
 # ============================================================================
 
-class Rendition(BaseModel):
-    """Single verse rendition in a specific translation."""
-
-    verse_id: str
-    translation: str
-    reference: str
-    text: str
-
-
 class CanonicalVerse(BaseModel):
     """Canonical verse metadata for graph neighbourhood responses."""
 
+    model_config = _DEFERRED
+
     cvk: str
     book_number: int
     chapter_number: int
@@ -195,6 +422,8 @@ class CanonicalVerse(BaseModel):
 class GraphNeighborhood(BaseModel):
     """Canonical verse node and its neighbouring renditions."""
 
+    model_config = _DEFERRED
+
     canonical: CanonicalVerse
     renditions: List[Rendition]
 
@@ -202,6 +431,8 @@ class GraphNeighborhood(BaseModel):
 class ParallelsResponse(BaseModel):
     """Parallel verses across translations."""
 
+    model_config = _DEFERRED
+
     cvk: str
     renditions: List[Rendition]
 
@@ -226,6 +457,8 @@ class TranslationEmbeddingStats(BaseModel):
         - Track ETL status for semantic search readiness
     """
 
+    model_config = _DEFERRED
+
     translation_code: str
     verses: int
     embedded: int
@@ -243,12 +476,14 @@ EmbeddingCoverage = TranslationEmbeddingStats
 class Asset(BaseModel):
     """Complete asset record with metadata and payload references."""
 
+    model_config = _DEFERRED
+
     asset_id: str
     media_type: Optional[str] = None
     title: Optional[str] = None
     description: Optional[str] = None
     text_payload: Optional[str] = None
-    payload_json: Optional[Dict[str, Any]] = None
+    payload_json: OpaqueJSON = None
     license: Optional[str] = None
     origin_url: Optional[str] = None
     created_at: Optional[datetime] = None
@@ -257,30 +492,35 @@ class Asset(BaseModel):
 class AssetCreate(BaseModel):
     """Payload for creating a new asset record."""
 
+    model_config = _DEFERRED
+
     media_type: str
     title: str
     description: Optional[str] = None
     text_payload: Optional[str] = None
-    payload_json: Optional[Dict[str, Any]] = None
+    payload_json: OpaqueJSON = None
     license: Optional[str] = None
     origin_url: Optional[str] = None
 
 
-class AssetUpdate(BaseModel):
-    """Partial update payload for asset records."""
-
-    media_type: Optional[str] = None
-    title: Optional[str] = None
-    description: Optional[str] = None
-    text_payload: Optional[str] = None
-    payload_json: Optional[Dict[str, Any]] = None
-    license: Optional[str] = None
-    origin_url: Optional[str] = None
+# Partial update payload: every AssetCreate field, made optional.
+AssetUpdate = create_model(
+    "AssetUpdate",
+    __config__=_DEFERRED,
+    __doc__="Partial update payload for asset records.",
+    __module__=__name__,
+    **{
+        name: (Optional[field.annotation], None)
+        for name, field in AssetCreate.model_fields.items()
+    },
+)
 
 
 class AssetListResponse(BaseModel):
     """Paginated list response containing asset summaries."""
 
+    model_config = _DEFERRED
+
     total: int
     items: List[Asset]
 
@@ -288,38 +528,43 @@ class AssetListResponse(BaseModel):
 class AssetEmbeddingRequest(BaseModel):
     """Request payload for providing or generating asset embeddings."""
 
-    embedding: Optional[List[float]] = None
+    model_config = _DEFERRED
+
+    embedding: Optional[Embedding] = None
     text: Optional[str] = None
     use_asset_text: bool = False
     model: str = "embeddinggemma"
     dim: int = 768
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: OpaqueJSON = None
 
 
 class AssetEmbeddingInfo(BaseModel):
     """Metadata response describing the stored asset embedding."""
 
+    model_config = _DEFERRED
+
     asset_id: str
     embedding_model: str
     embedding_dim: int
     embedding_ts: datetime
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: OpaqueJSON = None
     vector_length: Optional[int] = None
     generated: bool = False
 
 
-class AssetSearchRequest(BaseModel):
+class AssetSearchRequest(_EmbeddingInput):
     """Semantic search request over stored asset embeddings."""
 
-    embedding: List[float]
-    model: str = "embeddinggemma"
-    dim: int = 768
+    model_config = _DEFERRED
+
     top_k: int = Field(10, ge=1, le=200)
 
 
 class AssetSearchHit(BaseModel):
     """Single asset search result with similarity score."""
 
+    model_config = _DEFERRED_HIT
+
     asset_id: str
     media_type: Optional[str] = None
     title: Optional[str] = None
@@ -331,6 +576,8 @@ class AssetSearchHit(BaseModel):
 class AssetSearchResponse(BaseModel):
     """Container for semantic asset search results."""
 
+    model_config = _DEFERRED
+
     total: int
     items: List[AssetSearchHit]
 
@@ -338,7 +585,9 @@ class AssetSearchResponse(BaseModel):
 class AssetLinkRequest(BaseModel):
     """Request payload for linking an asset to verse references."""
 
-    verse_ids: List[str] = Field(..., min_length=1)
+    model_config = _DEFERRED
+
+    verse_ids: VerseIdList = Field(..., min_length=1)
     relation: str = Field("related", min_length=1, max_length=64)
     chunk_id: Optional[str] = None
 
@@ -346,6 +595,8 @@ class AssetLinkRequest(BaseModel):
 class AssetLinkResponse(BaseModel):
     """Response summarizing asset to verse link creation."""
 
+    model_config = _DEFERRED
+
     asset_id: str
     added: int
     skipped: int
@@ -354,6 +605,8 @@ class AssetLinkResponse(BaseModel):
 class AssetUnlinkResponse(BaseModel):
     """Response summarizing link deletions for an asset."""
 
+    model_config = _DEFERRED
+
     asset_id: str
     removed: int
 
@@ -361,6 +614,8 @@ class AssetUnlinkResponse(BaseModel):
 class AssetVerseLink(BaseModel):
     """Detailed representation of an asset-to-verse relationship."""
 
+    model_config = _DEFERRED_HIT
+
     verse_id: str
     relation: Optional[str] = None
     chunk_id: Optional[str] = None
@@ -376,6 +631,8 @@ class AssetVerseLink(BaseModel):
 class AssetLinkListResponse(BaseModel):
     """Collection response for asset verse links."""
 
+    model_config = _DEFERRED
+
     asset_id: str
     total: int
     items: List[AssetVerseLink]
@@ -388,6 +645,8 @@ class AssetLinkListResponse(BaseModel):
 class CanonicalVerseRef(BaseModel):
     """Canonical verse reference without translation."""
 
+    model_config = _DEFERRED
+
     book_number: int
     chapter_number: int
     verse_number: int
@@ -397,7 +656,9 @@ class CanonicalVerseRef(BaseModel):
 class BatchVerseRequest(BaseModel):
     """Request payload for batch verse retrieval."""
 
-    verse_ids: List[str] = Field(..., min_length=1, max_length=500)
+    verse_ids: VerseIdList = Field(
+        ..., min_length=1, max_length=_MAX_BATCH_IDS
+    )
 
 
 class BatchVerseResponse(BaseModel):
@@ -410,6 +671,8 @@ class BatchVerseResponse(BaseModel):
 class TranslationVerseEntry(BaseModel):
     """Single verse entry in a translation comparison."""
 
+    model_config = _DEFERRED
+
     translation_code: str
     verse_id: Optional[str] = None
     text: Optional[str] = None
@@ -418,6 +681,8 @@ class TranslationVerseEntry(BaseModel):
 class TranslationComparisonItem(BaseModel):
     """Comparison of a single verse across multiple translations."""
 
+    model_config = _DEFERRED
+
     reference: CanonicalVerseRef
     translations: List[TranslationVerseEntry]
     missing_translations: List[str]
@@ -426,6 +691,8 @@ class TranslationComparisonItem(BaseModel):
 class TranslationComparisonRequest(BaseModel):
     """Request for comparing verses across translations."""
 
+    model_config = _DEFERRED
+
     references: List[CanonicalVerseRef] = Field(..., min_length=1, max_length=200)
     translations: List[str] = Field(..., min_length=1, max_length=25)
 
@@ -433,14 +700,18 @@ class TranslationComparisonRequest(BaseModel):
 class TranslationComparisonResponse(BaseModel):
     """Response containing translation comparisons."""
 
+    model_config = _DEFERRED
+
     items: List[TranslationComparisonItem]
 
 
 class EmbeddingVector(BaseModel):
     """Embedding vector with metadata."""
 
+    model_config = _DEFERRED
+
     verse_id: str
-    embedding: List[float]
+    embedding: Embedding
     embedding_model: str
     embedding_dim: int
 
@@ -448,13 +719,17 @@ class EmbeddingVector(BaseModel):
 class EmbeddingLookupRequest(BaseModel):
     """Request for looking up verse embeddings."""
 
-    verse_ids: List[str] = Field(..., min_length=1, max_length=500)
+    model_config = _DEFERRED
+
+    verse_ids: VerseIdList = Field(..., min_length=1, max_length=_MAX_BATCH_IDS)
     model: str = "embeddinggemma"
 
 
 class EmbeddingLookupResponse(BaseModel):
     """Response containing verse embeddings."""
 
+    model_config = _DEFERRED
+
     results: List[EmbeddingVector]
     missing_ids: List[str]
 
@@ -464,6 +739,12 @@ class EmbeddingLookupResponse(BaseModel):
 # ============================================================================
 
 
+# Conversational roles accepted on session messages. pydantic-core resolves a
+# string Literal with a hash lookup, so this stays a Literal (and an enum in
+# the OpenAPI schema) rather than a Python-side set check.
+MessageRole = Literal["system", "user", "assistant", "tool"]
+
+
 class SessionCitationBase(BaseModel):
     """Common fields shared by session citation payloads.
 
@@ -478,17 +759,10 @@ class SessionCitationBase(BaseModel):
             describe structured citation details.
     """
 
-    source_type: str
-    source_id: str
+    source_type: NonEmptyStr
+    source_id: NonEmptyStr
     snippet: Optional[str] = None
-    metadata: Optional[Dict[str, Any]] = None
-
-    @field_validator("source_type", "source_id")
-    @classmethod
-    def _validate_non_empty(cls, value: str) -> str:
-        if not value or not value.strip():
-            raise ValueError("value must not be empty")
-        return value
+    metadata: OpaqueJSON = None
 
 
 class SessionCitationCreate(SessionCitationBase):
@@ -511,8 +785,8 @@ class SessionCitation(SessionCitationBase):
     created_at: datetime
 
 
-class SessionMessageAppendRequest(BaseModel):
-    """Client payload for appending content to a conversation session.
+class _SessionMessageFields(BaseModel):
+    """Message fields shared by client payloads and persisted records.
 
     Attributes:
         role: The conversational role associated with the message. Supports the
@@ -520,24 +794,25 @@ class SessionMessageAppendRequest(BaseModel):
             ``tool``).
         content: Natural language content for the message.
         metadata: Optional arbitrary metadata attached to the message.
+    """
+
+    role: MessageRole
+    content: NonEmptyStr
+    metadata: OpaqueJSON = None
+
+
+class SessionMessageAppendRequest(_SessionMessageFields):
+    """Client payload for appending content to a conversation session.
+
+    Attributes:
         citations: Optional collection of citation descriptors that should be
             linked to the message when persisted.
     """
 
-    role: Literal["system", "user", "assistant", "tool"]
-    content: str
-    metadata: Optional[Dict[str, Any]] = None
     citations: List[SessionCitationCreate] = Field(default_factory=list)
 
-    @field_validator("content")
-    @classmethod
-    def _validate_content(cls, value: str) -> str:
-        if not value or not value.strip():
-            raise ValueError("content must not be empty")
-        return value
-
 
-class SessionMessage(SessionMessageAppendRequest):
+class SessionMessage(_SessionMessageFields):
     """Message enriched with persistence metadata and attached citations.
 
     Attributes:
@@ -573,18 +848,11 @@ class SessionMessageUpdate(BaseModel):
         citations: Optional replacement citation descriptors for the message.
     """
 
-    role: Optional[Literal["system", "user", "assistant", "tool"]] = None
-    content: Optional[str] = None
-    metadata: Optional[Dict[str, Any]] = None
+    role: Optional[MessageRole] = None
+    content: Optional[NonEmptyStr] = None
+    metadata: OpaqueJSON = None
     citations: Optional[List[SessionCitationCreate]] = None
 
-    @field_validator("content")
-    @classmethod
-    def _validate_content(cls, value: Optional[str]) -> Optional[str]:
-        if value is not None and not value.strip():
-            raise ValueError("content must not be empty")
-        return value
-
 
 class SessionContextResponse(BaseModel):
     """Paginated response containing a slice of session memory.
@@ -608,16 +876,16 @@ class SessionContextResponse(BaseModel):
 # Chunk Search Models - Sliding window embeddings
 # ============================================================================
 
-class ChunkSearchQuery(BaseModel):
+class ChunkSearchQuery(_EmbeddingInput):
     """Chunk-based semantic search query parameters."""
 
-    embedding: List[float] = Field(
+    embedding: Embedding = Field(
         ..., min_length=768, max_length=4096, description="Query embedding vector"
     )
     model: str = Field(
         "embeddinggemma", description="Embedding model identifier used to generate the vector"
     )
-    dim: int = Field(768, ge=1, le=4096, description="Embedding dimensionality")
+    dim: int = Field(768, ge=768, le=4096, description="Embedding dimensionality")
     translation: Optional[str] = Field(
         None, description="Restrict results to a specific translation code"
     )
@@ -636,20 +904,12 @@ class ChunkSearchQuery(BaseModel):
         False, description="Include concatenated verse context before and after the chunk"
     )
 
-    @field_validator("embedding")
-    @classmethod
-    def validate_embedding_length(cls, v: List[float], info: Any) -> List[float]:
-        """Ensure the embedding vector length matches the declared dimension."""
-
-        dim = info.data.get("dim", 768)
-        if len(v) != dim:
-            raise ValueError(f"Embedding length {len(v)} does not match dim={dim}")
-        return v
-
 
 class ChunkHit(BaseModel):
     """Single chunk search result with verse range metadata."""
 
+    model_config = _HIT
+
     chunk_id: str
     translation_code: str
     book_number: int
@@ -687,6 +947,8 @@ class ChunkSearchResponse(BaseModel):
 class ModeCount(BaseModel):
     """Search mode distribution within a time window."""
 
+    model_config = _DEFERRED
+
     mode: Optional[str]
     count: int
     percentage: float
@@ -695,6 +957,8 @@ class ModeCount(BaseModel):
 class TopQuery(BaseModel):
     """Frequently executed query with recent activity timestamp."""
 
+    model_config = _DEFERRED
+
     query: str
     count: int
     last_seen: datetime
@@ -703,6 +967,8 @@ class TopQuery(BaseModel):
 class QueryCounts(BaseModel):
     """Aggregate query metrics for a time window."""
 
+    model_config = _DEFERRED
+
     total: int
     unique_users: int
     average_latency_ms: Optional[float]
@@ -713,6 +979,8 @@ class QueryCounts(BaseModel):
 class TrendPoint(BaseModel):
     """Time-series bucket representing query volume."""
 
+    model_config = _DEFERRED_HIT
+
     bucket_start: datetime
     bucket_end: datetime
     count: int
@@ -721,6 +989,8 @@ class TrendPoint(BaseModel):
 class QueryTrends(BaseModel):
     """Query trend time-series for analytics dashboards."""
 
+    model_config = _DEFERRED
+
     interval: Literal["hour", "day"]
     points: List[TrendPoint]
 
@@ -728,6 +998,8 @@ class QueryTrends(BaseModel):
 class TranslationUsage(BaseModel):
     """Usage metric for a translation within the time window."""
 
+    model_config = _DEFERRED
+
     translation_code: Optional[str]
     count: int
     percentage: float
@@ -736,6 +1008,8 @@ class TranslationUsage(BaseModel):
 class BookUsage(BaseModel):
     """Usage metric summarising which books appear in top results."""
 
+    model_config = _DEFERRED
+
     book_number: int
     book_name: str
     count: int
@@ -745,6 +1019,8 @@ class BookUsage(BaseModel):
 class UsageStats(BaseModel):
     """Aggregated usage statistics for translations and books."""
 
+    model_config = _DEFERRED
+
     translations: List[TranslationUsage]
     books: List[BookUsage]
 
@@ -752,6 +1028,8 @@ class UsageStats(BaseModel):
 class AnalyticsOverview(BaseModel):
     """Composite analytics payload used by analytics endpoints."""
 
+    model_config = _DEFERRED
+
     window_start: datetime
     window_end: datetime
     query_counts: QueryCounts
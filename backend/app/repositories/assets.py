@@ -270,14 +270,13 @@ class AssetRepository:
             asset_id,
         )
         links: List[AssetVerseLink] = []
-        for row in rows:
-            record = dict(row)
+        for record in rows:
             reference = (
                 f"{record['translation_code']} "
                 f"{record['book_number']}:{record['chapter_number']}:{record['verse_number']}{record['suffix']}"
             )
             links.append(
-                AssetVerseLink(
+                AssetVerseLink.model_construct(
                     verse_id=record["verse_id"],
                     relation=record["relation"],
                     chunk_id=record["chunk_id"],
@@ -8,7 +8,7 @@ service or routing layers.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import asyncpg
 
@@ -27,6 +27,8 @@ class SessionMemoryRepository:
             statements.
     """
 
+    __slots__ = ("_conn",)
+
     def __init__(self, conn: asyncpg.Connection) -> None:
         self._conn = conn
 
@@ -115,12 +117,19 @@ class SessionMemoryRepository:
         *,
         limit: int,
         offset: int,
-    ) -> List[SessionMessage]:
-        """List messages for a session with pagination semantics."""
+    ) -> Tuple[List[SessionMessage], int]:
+        """List a page of session messages together with the session total.
+
+        The total comes from a ``count(*) OVER ()`` window on the page query,
+        so a single index scan over ``(session_id, message_id)`` serves both.
+        An empty page past the first carries no total, so only then is a
+        separate count issued.
+        """
 
         rows = await self._conn.fetch(
             """
-            SELECT message_id, session_id, role, content, metadata, created_at
+            SELECT message_id, session_id, role, content, metadata, created_at,
+                   count(*) OVER () AS total
               FROM session_memory
              WHERE session_id = $1
              ORDER BY message_id ASC
@@ -131,14 +140,16 @@ class SessionMemoryRepository:
             offset,
         )
         if not rows:
-            return []
+            total = await self.count_messages(session_id) if offset else 0
+            return [], total
 
         message_ids = [row["message_id"] for row in rows]
         citations_map = await self.get_citations_for_messages(message_ids)
-        return [
+        messages = [
             self._row_to_message(row, citations_map.get(row["message_id"], []))
             for row in rows
         ]
+        return messages, int(rows[0]["total"])
 
     async def count_messages(self, session_id: str) -> int:
         """Count the number of messages stored for a session."""
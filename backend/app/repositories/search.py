@@ -10,6 +10,8 @@ import asyncpg
 class SearchRepository:
     """Repository providing SQL access for search endpoints."""
 
+    __slots__ = ("_conn",)
+
     def __init__(self, conn: asyncpg.Connection) -> None:
         self._conn = conn
 
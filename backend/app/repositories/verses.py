@@ -26,7 +26,7 @@ class VerseRepository:
             """,
             verse_id,
         )
-        return Verse(**dict(row)) if row else None
+        return Verse.model_construct(**dict(row)) if row else None
 
     async def list_chapter_verses(
         self,
@@ -54,7 +54,7 @@ class VerseRepository:
             limit,
             offset,
         )
-        return [VerseLite(**dict(r)) for r in rows]
+        return [VerseLite.model_construct(**dict(r)) for r in rows]
 
     async def list_translations(self) -> List[Translation]:
         """Return all translation metadata."""
@@ -2,31 +2,72 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import NamedTuple
 
 import asyncpg
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 
-from ..db.postgres_async import get_pg
+from ..config import settings
+from ..db.postgres_async import get_pg_pool
+from ..dependencies.cache import get_cache_manager
 from ..models import AnalyticsOverview, QueryCounts, QueryTrends, UsageStats
 from ..services.analytics import AnalyticsService
+from ..utils.cache import CacheManager
+from ..utils.responses import PydanticJSONResponse
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
 
-def _service(conn: asyncpg.Connection) -> AnalyticsService:
-    """Factory helper returning a configured analytics service."""
+def get_analytics_service(
+    pool: asyncpg.Pool = Depends(get_pg_pool),
+    cache: CacheManager = Depends(get_cache_manager),
+) -> AnalyticsService:
+    """Provide an analytics service that memoises results per time window."""
 
-    return AnalyticsService(conn)
+    return AnalyticsService(pool, cache=cache, cache_ttl=settings.ANALYTICS_CACHE_TTL_SECONDS)
 
 
-@router.get("/overview", response_model=AnalyticsOverview)
-async def analytics_overview(
+class AnalyticsWindow(NamedTuple):
+    """Optional start/end bounds for an analytics query."""
+
+    start: datetime | None
+    end: datetime | None
+
+
+def _from_epoch(seconds: int) -> datetime:
+    try:
+        return datetime.fromtimestamp(seconds, tz=timezone.utc)
+    except (OverflowError, OSError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail="epoch timestamp out of range") from exc
+
+
+def analytics_window(
     start: datetime | None = None,
     end: datetime | None = None,
+    start_ts: int | None = Query(
+        None, description="Window start as epoch seconds; overrides start"
+    ),
+    end_ts: int | None = Query(None, description="Window end as epoch seconds; overrides end"),
+) -> AnalyticsWindow:
+    """Resolve the query window from ISO-8601 or epoch-second parameters.
+
+    Dashboards polling these endpoints can send ``start_ts``/``end_ts``
+    integers, which skip ISO-8601 parsing entirely.
+    """
+
+    return AnalyticsWindow(
+        start=_from_epoch(start_ts) if start_ts is not None else start,
+        end=_from_epoch(end_ts) if end_ts is not None else end,
+    )
+
+
+@router.get("/overview", response_model=AnalyticsOverview)
+async def analytics_overview(
+    window: AnalyticsWindow = Depends(analytics_window),
     interval: str | None = None,
-    conn: asyncpg.Connection = Depends(get_pg),
-) -> AnalyticsOverview:
+    service: AnalyticsService = Depends(get_analytics_service),
+) -> PydanticJSONResponse:
     """Return comprehensive analytics over the requested window.
 
     Example:
@@ -68,28 +109,29 @@ async def analytics_overview(
         ```
 
     Performance:
-        Runs a handful of aggregation queries (Timescale friendly) and typically
-        completes in < 30ms on indexed search_log data.
+        Runs a handful of aggregation queries (Timescale friendly) concurrently
+        on separate pool connections and typically completes in < 30ms on
+        indexed search_log data.
     """
 
-    service = _service(conn)
     try:
-        return await service.overview(start=start, end=end, interval=interval)
+        overview = await service.overview(start=window.start, end=window.end, interval=interval)
+        return await PydanticJSONResponse.create(overview)
     except ValueError as exc:  # pragma: no cover - FastAPI handles HTTP response
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
 @router.get("/counts", response_model=QueryCounts)
 async def analytics_counts(
-    start: datetime | None = None,
-    end: datetime | None = None,
-    conn: asyncpg.Connection = Depends(get_pg),
-) -> QueryCounts:
+    window: AnalyticsWindow = Depends(analytics_window),
+    service: AnalyticsService = Depends(get_analytics_service),
+) -> PydanticJSONResponse:
     """Return aggregate query counts and top search terms.
 
     Example:
         ```bash
         curl "http://localhost:8000/v1/analytics/counts?end=2024-02-01T00:00:00Z"
+        curl "http://localhost:8000/v1/analytics/counts?start_ts=1704067200&end_ts=1706745600"
         ```
 
     Performance:
@@ -97,20 +139,18 @@ async def analytics_counts(
         usually returns in < 15ms on a warm cache.
     """
 
-    service = _service(conn)
     try:
-        return await service.counts(start=start, end=end)
+        return PydanticJSONResponse(await service.counts(start=window.start, end=window.end))
     except ValueError as exc:  # pragma: no cover - FastAPI handles HTTP response
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
 @router.get("/trends", response_model=QueryTrends)
 async def analytics_trends(
-    start: datetime | None = None,
-    end: datetime | None = None,
+    window: AnalyticsWindow = Depends(analytics_window),
     interval: str | None = None,
-    conn: asyncpg.Connection = Depends(get_pg),
-) -> QueryTrends:
+    service: AnalyticsService = Depends(get_analytics_service),
+) -> PydanticJSONResponse:
     """Return time-series query trends for dashboards.
 
     Example:
@@ -123,19 +163,18 @@ async def analytics_trends(
         for Timescale chunking and expected to run in < 20ms for week-long ranges.
     """
 
-    service = _service(conn)
     try:
-        return await service.trends(start=start, end=end, interval=interval)
+        trends = await service.trends(start=window.start, end=window.end, interval=interval)
+        return PydanticJSONResponse(trends)
     except ValueError as exc:  # pragma: no cover - FastAPI handles HTTP response
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
 @router.get("/usage", response_model=UsageStats)
 async def analytics_usage(
-    start: datetime | None = None,
-    end: datetime | None = None,
-    conn: asyncpg.Connection = Depends(get_pg),
-) -> UsageStats:
+    window: AnalyticsWindow = Depends(analytics_window),
+    service: AnalyticsService = Depends(get_analytics_service),
+) -> PydanticJSONResponse:
     """Return translation and book usage statistics derived from logs.
 
     Example:
@@ -148,8 +187,7 @@ async def analytics_usage(
         should complete in roughly 20ms on indexed datasets.
     """
 
-    service = _service(conn)
     try:
-        return await service.usage(start=start, end=end)
+        return PydanticJSONResponse(await service.usage(start=window.start, end=window.end))
     except ValueError as exc:  # pragma: no cover - FastAPI handles HTTP response
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -31,6 +31,7 @@ from ..models import (
 )
 from ..services.assets import AssetService
 from ..services.embeddings import EmbeddingsService
+from ..utils.responses import PydanticJSONResponse
 
 router = APIRouter(prefix="/assets", tags=["assets"])
 
@@ -173,7 +174,7 @@ async def delete_asset(
 async def search_assets(
     request: AssetSearchRequest,
     service: AssetService = Depends(get_asset_service),
-) -> AssetSearchResponse:
+) -> PydanticJSONResponse:
     """Semantic search across assets using pgvector similarity.
 
     Args:
@@ -185,7 +186,7 @@ async def search_assets(
     """
 
     try:
-        return await service.search_by_embedding(request)
+        return PydanticJSONResponse(await service.search_by_embedding(request))
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
@@ -15,6 +15,7 @@ from ..models import (
     TranslationComparisonResponse,
 )
 from ..services.batch import BatchService
+from ..utils.responses import PydanticJSONResponse
 
 router = APIRouter(prefix="/batch", tags=["batch"])
 
@@ -22,7 +23,7 @@ router = APIRouter(prefix="/batch", tags=["batch"])
 @router.post("/verses", response_model=BatchVerseResponse)
 async def fetch_batch_verses(
     payload: BatchVerseRequest, conn: asyncpg.Connection = Depends(get_pg)
-) -> BatchVerseResponse:
+) -> PydanticJSONResponse:
     """
     Retrieve multiple verses in a single request.
 
@@ -40,7 +41,7 @@ async def fetch_batch_verses(
     """
 
     service = BatchService(conn)
-    return await service.fetch_verses(payload)
+    return PydanticJSONResponse(await service.fetch_verses(payload))
 
 
 @router.post("/translations/compare", response_model=TranslationComparisonResponse)
@@ -74,7 +75,7 @@ async def compare_translations(
 @router.post("/embeddings", response_model=EmbeddingLookupResponse)
 async def lookup_embeddings(
     payload: EmbeddingLookupRequest, conn: asyncpg.Connection = Depends(get_pg)
-) -> EmbeddingLookupResponse:
+) -> PydanticJSONResponse:
     """
     Retrieve cached embeddings for verses.
 
@@ -91,5 +92,5 @@ async def lookup_embeddings(
     """
 
     service = BatchService(conn)
-    return await service.lookup_embeddings(payload)
+    return PydanticJSONResponse(await service.lookup_embeddings(payload))
 
@@ -8,14 +8,16 @@ import asyncpg
 from ..db.postgres_async import get_pg
 from ..models import ChunkHit, ChunkSearchQuery, ChunkSearchResponse
 from ..services.chunks import ChunkService
+from ..utils.responses import PydanticJSONResponse
+from ..utils.routing import ORJSONRoute
 
-router = APIRouter(prefix="/chunks", tags=["chunks"])
+router = APIRouter(prefix="/chunks", tags=["chunks"], route_class=ORJSONRoute)
 
 
 @router.post("/search", response_model=ChunkSearchResponse)
 async def search_chunks(
     query: ChunkSearchQuery, conn: asyncpg.Connection = Depends(get_pg)
-) -> ChunkSearchResponse:
+) -> PydanticJSONResponse:
     """Perform semantic chunk search with optional verse context."""
 
     """
@@ -33,7 +35,7 @@ async def search_chunks(
     """
 
     service = ChunkService(conn)
-    return await service.search(query)
+    return PydanticJSONResponse(await service.search(query))
 
 
 @router.get("/{chunk_id}", response_model=ChunkHit)
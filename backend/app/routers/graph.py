@@ -5,32 +5,39 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, HTTPException, status
 from neo4j import AsyncSession
 
+from ..config import settings
 from ..db.neo4j import get_neo4j_session
+from ..dependencies.cache import get_cache_manager
 from ..models import GraphNeighborhood
 from ..services.graph import (
     GraphQueryService,
     InvalidVerseIdentifier,
     VerseNeighborhoodNotFound,
 )
+from ..utils.cache import CacheManager
+from ..utils.responses import PydanticJSONResponse
 
 router = APIRouter(prefix="/graph", tags=["graph"])
 
 
-def get_graph_service(session: AsyncSession = Depends(get_neo4j_session)) -> GraphQueryService:
+def get_graph_service(
+    session: AsyncSession = Depends(get_neo4j_session),
+    cache: CacheManager = Depends(get_cache_manager),
+) -> GraphQueryService:
     """Provide a graph query service bound to the request session."""
 
-    return GraphQueryService(session)
+    return GraphQueryService(session, cache=cache, cache_ttl=settings.GRAPH_CACHE_TTL_SECONDS)
 
 
 @router.get("/verse/{cv_id}", response_model=GraphNeighborhood)
 async def get_verse_neighborhood(
     cv_id: str,
     service: GraphQueryService = Depends(get_graph_service),
-) -> GraphNeighborhood:
+) -> PydanticJSONResponse:
     """Return the canonical verse neighbourhood for the given CV identifier."""
 
     try:
-        return await service.neighborhood_by_cvk(cv_id)
+        return await PydanticJSONResponse.create(await service.neighborhood_by_cvk(cv_id))
     except InvalidVerseIdentifier as exc:  # pragma: no cover - defensive
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -48,11 +55,13 @@ async def get_parallel_neighborhood(
     translation: str,
     verse: str,
     service: GraphQueryService = Depends(get_graph_service),
-) -> GraphNeighborhood:
+) -> PydanticJSONResponse:
     """Return the neighbourhood for a translation-specific verse identifier."""
 
     try:
-        return await service.neighborhood_for_translation_verse(translation, verse)
+        return await PydanticJSONResponse.create(
+            await service.neighborhood_for_translation_verse(translation, verse)
+        )
     except InvalidVerseIdentifier as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
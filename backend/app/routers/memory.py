@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 import asyncpg
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from redis.asyncio import Redis
 
 from ..config import settings
 from ..db.postgres_async import get_pg
+from ..dependencies.redis import get_redis
 from ..models import (
     SessionContextResponse,
     SessionMessage,
@@ -14,24 +18,32 @@ from ..models import (
     SessionMessageUpdate,
 )
 from ..services.memory import SessionMemoryService
+from ..utils.routing import ORJSONRoute
 
-router = APIRouter(prefix="/sessions", tags=["session-memory"])
+router = APIRouter(prefix="/sessions", tags=["session-memory"], route_class=ORJSONRoute)
 
 
 async def get_session_memory_service(
     conn: asyncpg.Connection = Depends(get_pg),
+    redis: Optional[Redis] = Depends(get_redis),
 ) -> SessionMemoryService:
     """Provide a session memory service bound to the request scope.
 
     Parameters:
         conn: Dependency-injected PostgreSQL connection supplied by the
             application.
+        redis: Shared Redis client holding per-session message counters.
 
     Returns:
         A :class:`SessionMemoryService` configured for the active request.
     """
 
-    return SessionMemoryService(conn)
+    return SessionMemoryService(
+        conn,
+        redis=redis,
+        count_ttl=settings.SESSION_COUNT_CACHE_TTL_SECONDS,
+        namespace=settings.CACHE_NAMESPACE,
+    )
 
 
 @router.post(
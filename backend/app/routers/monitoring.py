@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import PlainTextResponse
+from starlette.concurrency import run_in_threadpool
 
 from ..config import settings
 from ..utils.metrics import metrics_response
@@ -18,5 +19,5 @@ async def prometheus_metrics() -> PlainTextResponse:
     if not settings.METRICS_ENABLED:
         raise HTTPException(status_code=404, detail="Metrics disabled")
 
-    payload, content_type = metrics_response()
-    return PlainTextResponse(content=payload.decode("utf-8"), media_type=content_type)
+    payload, content_type = await run_in_threadpool(metrics_response)
+    return PlainTextResponse(content=payload, media_type=content_type)
@@ -7,18 +7,20 @@ from fastapi import APIRouter, Depends, HTTPException
 from ..dependencies.retrieval import get_retrieval_orchestrator
 from ..models import RetrievalQuery, RetrievalResponse
 from ..services.retrieval_orchestrator import RetrievalOrchestrator
+from ..utils.responses import PydanticJSONResponse
+from ..utils.routing import ORJSONRoute
 
-router = APIRouter(prefix="/retrieval", tags=["retrieval"])
+router = APIRouter(prefix="/retrieval", tags=["retrieval"], route_class=ORJSONRoute)
 
 
 @router.post("/query", response_model=RetrievalResponse)
 async def orchestrated_retrieval(
     body: RetrievalQuery,
     orchestrator: RetrievalOrchestrator = Depends(get_retrieval_orchestrator),
-) -> RetrievalResponse:
+) -> PydanticJSONResponse:
     """Execute hybrid search with manifest-driven fusion and graph expansion."""
 
     try:
-        return await orchestrator.retrieve(body)
+        return PydanticJSONResponse(await orchestrator.retrieve(body))
     except ValueError as exc:  # propagate validation errors as HTTP 400
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -32,8 +32,10 @@ from fastapi import APIRouter, Depends, HTTPException
 from ..db.postgres_async import get_pg
 from ..models import FTSQuery, VectorQuery, HybridQuery, SearchResponse
 from ..services.search_api import SearchApiService
+from ..utils.responses import PydanticJSONResponse
+from ..utils.routing import ORJSONRoute
 
-router = APIRouter(prefix="/search", tags=["search"])
+router = APIRouter(prefix="/search", tags=["search"], route_class=ORJSONRoute)
 
 
 def get_search_service(conn: asyncpg.Connection = Depends(get_pg)) -> SearchApiService:
@@ -46,7 +48,7 @@ def get_search_service(conn: asyncpg.Connection = Depends(get_pg)) -> SearchApiS
 async def search_fts(
     body: FTSQuery,
     service: SearchApiService = Depends(get_search_service),
-) -> SearchResponse:
+) -> PydanticJSONResponse:
     """Full-text search using PostgreSQL FTS with configurable dictionary.
 
     Performs lexical matching against verse text using PostgreSQL's text search
@@ -68,7 +70,7 @@ async def search_fts(
         Typical query time: 5-50ms depending on result set size.
     """
     try:
-        return await service.full_text_search(body)
+        return PydanticJSONResponse(await service.full_text_search(body))
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -77,7 +79,7 @@ async def search_fts(
 async def search_vector(
     body: VectorQuery,
     service: SearchApiService = Depends(get_search_service),
-) -> SearchResponse:
+) -> PydanticJSONResponse:
     """Semantic vector search using pgvector embeddings.
 
     Performs approximate nearest neighbour (ANN) search using cosine similarity
@@ -102,7 +104,7 @@ async def search_vector(
         Cosine similarity computed as ``1 - (embedding <=> query_vector)``.
     """
     try:
-        return await service.vector_search(body)
+        return PydanticJSONResponse(await service.vector_search(body))
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -111,7 +113,7 @@ async def search_vector(
 async def search_hybrid(
     body: HybridQuery,
     service: SearchApiService = Depends(get_search_service),
-) -> SearchResponse:
+) -> PydanticJSONResponse:
     """Hybrid search using Reciprocal Rank Fusion (RRF) to combine FTS + vector.
 
     Fuses results from full-text search and semantic vector search using the
@@ -142,6 +144,6 @@ async def search_hybrid(
         Cormack et al., "Reciprocal Rank Fusion outperforms Condorcet", SIGIR 2009
     """
     try:
-        return await service.hybrid_search(body)
+        return PydanticJSONResponse(await service.hybrid_search(body))
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -4,10 +4,10 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Annotated, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
 
 
 class UserRole(str, Enum):
@@ -21,6 +21,14 @@ class ShareScope(str, Enum):
     CUSTOM = "custom"
 
 
+# Response-only models are built once per request and never mutated.
+_RESPONSE = ConfigDict(frozen=True)
+
+# Local part, a single "@", and a dotted domain, with no whitespace. Matched by
+# pydantic-core's compiled regex rather than a Python-level validator.
+EmailAddress = Annotated[str, StringConstraints(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")]
+
+
 class SharePreference(BaseModel):
     """Visibility control for a single profile section."""
 
@@ -30,13 +38,7 @@ class SharePreference(BaseModel):
     @field_validator("allowed_user_ids")
     @classmethod
     def deduplicate(cls, value: List[UUID]) -> List[UUID]:
-        seen = set()
-        deduped: List[UUID] = []
-        for item in value:
-            if item not in seen:
-                seen.add(item)
-                deduped.append(item)
-        return deduped
+        return list(dict.fromkeys(value))
 
 
 class ProfileSurvey(BaseModel):
@@ -58,21 +60,16 @@ class ProfileSurvey(BaseModel):
 class RegistrationRequest(BaseModel):
     """Payload used to register a new account and optional profile."""
 
-    email: str
+    email: EmailAddress
     password: str = Field(min_length=8)
     display_name: str = Field(min_length=2)
     role: UserRole = UserRole.MEMBER
     profile: Optional[ProfileSurvey] = None
 
-    @field_validator("email")
-    @classmethod
-    def validate_email(cls, value: str) -> str:
-        if "@" not in value or value.startswith("@") or value.endswith("@"):
-            raise ValueError("email must include '@' and local part")
-        return value
-
 
 class UserSummary(BaseModel):
+    model_config = _RESPONSE
+
     user_id: UUID
     email: str
     display_name: str
@@ -84,6 +81,8 @@ class UserSummary(BaseModel):
 class ProfileResponse(BaseModel):
     """Profile data filtered according to visibility rules."""
 
+    model_config = _RESPONSE
+
     user: UserSummary
     profile: Optional[ProfileSurvey] = None
     hidden_fields: List[str] = Field(default_factory=list)
@@ -101,6 +100,8 @@ class ConversationCreate(BaseModel):
 
 
 class ConversationSummary(BaseModel):
+    model_config = _RESPONSE
+
     conversation_id: UUID
     user_id: UUID
     title: str
@@ -116,6 +117,8 @@ class MessageCreate(BaseModel):
 
 
 class MessageRecord(BaseModel):
+    model_config = _RESPONSE
+
     message_id: UUID
     conversation_id: UUID
     sender_role: str
@@ -126,6 +129,8 @@ class MessageRecord(BaseModel):
 
 
 class ConversationDetail(BaseModel):
+    model_config = _RESPONSE
+
     conversation: ConversationSummary
     messages: List[MessageRecord]
 
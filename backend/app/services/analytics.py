@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Sequence
+from typing import Awaitable, Callable, Optional, Sequence, TypeVar
 import asyncio
 
 import asyncpg
@@ -20,23 +20,35 @@ from ..models import (
     UsageStats,
 )
 from ..repositories.analytics import AnalyticsRepository
+from ..utils.cache import CacheManager
+
+# Width of each trend bucket, keyed by the supported interval names.
+_BUCKET_WIDTHS = {"hour": timedelta(hours=1), "day": timedelta(days=1)}
+
+_T = TypeVar("_T")
 
 
 class AnalyticsService:
     """High-level analytics computations built on top of :class:`AnalyticsRepository`."""
 
+    __slots__ = ("repo", "top_queries", "top_translations", "top_books", "cache", "cache_ttl")
+
     def __init__(
         self,
-        conn: asyncpg.Connection,
+        conn: asyncpg.Connection | asyncpg.Pool,
         *,
         top_queries: int = 10,
         top_translations: int = 10,
         top_books: int = 10,
+        cache: Optional[CacheManager] = None,
+        cache_ttl: int = 0,
     ) -> None:
         self.repo = AnalyticsRepository(conn)
         self.top_queries = top_queries
         self.top_translations = top_translations
         self.top_books = top_books
+        self.cache = cache
+        self.cache_ttl = cache_ttl
 
     async def overview(
         self,
@@ -49,7 +61,17 @@ class AnalyticsService:
 
         window_start, window_end = self._resolve_window(start, end)
         bucket_interval = self._resolve_interval(interval, window_start, window_end)
+        return await self._memoize(
+            "overview",
+            window_start,
+            window_end,
+            bucket_interval,
+            lambda: self._overview(window_start, window_end, bucket_interval),
+        )
 
+    async def _overview(
+        self, window_start: datetime, window_end: datetime, bucket_interval: str
+    ) -> AnalyticsOverview:
         (
             summary_row,
             mode_rows,
@@ -70,7 +92,7 @@ class AnalyticsService:
         trends = self._build_trends(bucket_interval, trend_rows)
         usage = self._build_usage(summary_row, translation_rows, book_rows)
 
-        return AnalyticsOverview(
+        return AnalyticsOverview.model_construct(
             window_start=window_start,
             window_end=window_end,
             query_counts=query_counts,
@@ -89,6 +111,17 @@ class AnalyticsService:
 
         window_start, window_end = self._resolve_window(start, end)
         bucket_interval = self._resolve_interval(interval, window_start, window_end)
+        return await self._memoize(
+            "trends",
+            window_start,
+            window_end,
+            bucket_interval,
+            lambda: self._trends(window_start, window_end, bucket_interval),
+        )
+
+    async def _trends(
+        self, window_start: datetime, window_end: datetime, bucket_interval: str
+    ) -> QueryTrends:
         rows = await self.repo.fetch_query_trend(window_start, window_end, bucket_interval)
         return self._build_trends(bucket_interval, rows)
 
@@ -101,8 +134,17 @@ class AnalyticsService:
         """Return usage metrics only."""
 
         window_start, window_end = self._resolve_window(start, end)
-        summary_row = await self.repo.fetch_query_summary(window_start, window_end)
-        translation_rows, book_rows = await asyncio.gather(
+        return await self._memoize(
+            "usage",
+            window_start,
+            window_end,
+            None,
+            lambda: self._usage(window_start, window_end),
+        )
+
+    async def _usage(self, window_start: datetime, window_end: datetime) -> UsageStats:
+        summary_row, translation_rows, book_rows = await asyncio.gather(
+            self.repo.fetch_query_summary(window_start, window_end),
             self.repo.fetch_translation_usage(window_start, window_end, self.top_translations),
             self.repo.fetch_book_usage(window_start, window_end, self.top_books),
         )
@@ -117,6 +159,15 @@ class AnalyticsService:
         """Return query count summary only."""
 
         window_start, window_end = self._resolve_window(start, end)
+        return await self._memoize(
+            "counts",
+            window_start,
+            window_end,
+            None,
+            lambda: self._counts(window_start, window_end),
+        )
+
+    async def _counts(self, window_start: datetime, window_end: datetime) -> QueryCounts:
         summary_row, mode_rows, top_rows = await asyncio.gather(
             self.repo.fetch_query_summary(window_start, window_end),
             self.repo.fetch_mode_breakdown(window_start, window_end),
@@ -124,10 +175,45 @@ class AnalyticsService:
         )
         return self._build_query_counts(summary_row, mode_rows, top_rows)
 
+    async def _memoize(
+        self,
+        name: str,
+        window_start: datetime,
+        window_end: datetime,
+        interval: Optional[str],
+        compute: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        """Serve ``compute()`` from the cache for an identical window.
+
+        The key holds the exact bounds ``compute()`` runs over, so a cached
+        result always reports the window it was computed for. Rolling windows
+        share entries because :meth:`_resolve_window` aligns their end to the
+        TTL slot.
+        """
+
+        if self.cache is None or self.cache_ttl <= 0:
+            return await compute()
+
+        key = (
+            f"analytics:{name}:{window_start.timestamp()}:"
+            f"{window_end.timestamp()}:{interval or ''}"
+        )
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return cached
+        result = await compute()
+        await self.cache.set(key, result, ttl=self.cache_ttl)
+        return result
+
     def _resolve_window(
         self, start: Optional[datetime], end: Optional[datetime]
     ) -> tuple[datetime, datetime]:
         now = datetime.now(timezone.utc)
+        if self.cache is not None and self.cache_ttl > 0:
+            # Align the default "now" end to the TTL slot so polling dashboards
+            # share one cached window
+            slot = int(now.timestamp()) // self.cache_ttl * self.cache_ttl
+            now = datetime.fromtimestamp(slot, timezone.utc)
         window_end = end.astimezone(timezone.utc) if end else now
         window_start = start.astimezone(timezone.utc) if start else window_end - timedelta(days=7)
         if window_start >= window_end:
@@ -139,7 +225,7 @@ class AnalyticsService:
     ) -> str:
         if interval:
             interval = interval.lower()
-            if interval not in {"hour", "day"}:
+            if interval not in _BUCKET_WIDTHS:
                 raise ValueError("interval must be 'hour' or 'day'")
             return interval
         delta = end - start
@@ -157,15 +243,15 @@ class AnalyticsService:
         unique_users = int(summary_row["unique_users"]) if summary_row and summary_row["unique_users"] else 0
         avg_latency = float(summary_row["avg_latency_ms"]) if summary_row and summary_row["avg_latency_ms"] is not None else None
 
+        scale = self._percent_scale(total_queries)
         mode_breakdown: list[ModeCount] = []
         for row in mode_rows:
             count = int(row["count"]) if row["count"] is not None else 0
-            percentage = (count / total_queries * 100.0) if total_queries else 0.0
             mode_breakdown.append(
-                ModeCount(
+                ModeCount.model_construct(
                     mode=row["mode"],
                     count=count,
-                    percentage=percentage,
+                    percentage=count * scale,
                 )
             )
 
@@ -174,14 +260,14 @@ class AnalyticsService:
             if row["query"] is None:
                 continue
             top_queries.append(
-                TopQuery(
+                TopQuery.model_construct(
                     query=row["query"],
                     count=int(row["count"]) if row["count"] is not None else 0,
                     last_seen=row["last_seen"],
                 )
             )
 
-        return QueryCounts(
+        return QueryCounts.model_construct(
             total=total_queries,
             unique_users=unique_users,
             average_latency_ms=avg_latency,
@@ -192,19 +278,19 @@ class AnalyticsService:
     def _build_trends(
         self, interval: str, rows: Sequence[asyncpg.Record]
     ) -> QueryTrends:
+        width = self._bucket_width(interval)
         points: list[TrendPoint] = []
         for row in rows:
             bucket_start = row["bucket_start"]
             count = int(row["count"]) if row["count"] is not None else 0
-            bucket_end = self._bucket_end(bucket_start, interval)
             points.append(
-                TrendPoint(
+                TrendPoint.model_construct(
                     bucket_start=bucket_start,
-                    bucket_end=bucket_end,
+                    bucket_end=bucket_start + width,
                     count=count,
                 )
             )
-        return QueryTrends(interval=interval, points=points)
+        return QueryTrends.model_construct(interval=interval, points=points)
 
     def _build_usage(
         self,
@@ -214,40 +300,44 @@ class AnalyticsService:
     ) -> UsageStats:
         total_queries = int(summary_row["total_queries"]) if summary_row and summary_row["total_queries"] else 0
 
+        scale = self._percent_scale(total_queries)
         translation_stats: list[TranslationUsage] = []
         for row in translation_rows:
             count = int(row["count"]) if row["count"] is not None else 0
-            percentage = (count / total_queries * 100.0) if total_queries else 0.0
             translation_stats.append(
-                TranslationUsage(
+                TranslationUsage.model_construct(
                     translation_code=row["translation_code"],
                     count=count,
-                    percentage=percentage,
+                    percentage=count * scale,
                 )
             )
 
         total_book_occurrences = sum(int(row["count"]) for row in book_rows if row["count"] is not None)
+        scale = self._percent_scale(total_book_occurrences)
         book_stats: list[BookUsage] = []
         for row in book_rows:
             count = int(row["count"]) if row["count"] is not None else 0
             if row["book_number"] is None:
                 continue
-            percentage = (count / total_book_occurrences * 100.0) if total_book_occurrences else 0.0
             book_stats.append(
-                BookUsage(
+                BookUsage.model_construct(
                     book_number=int(row["book_number"]),
                     book_name=row["book_name"],
                     count=count,
-                    percentage=percentage,
+                    percentage=count * scale,
                 )
             )
 
-        return UsageStats(translations=translation_stats, books=book_stats)
+        return UsageStats.model_construct(translations=translation_stats, books=book_stats)
+
+    @staticmethod
+    def _percent_scale(total: int) -> float:
+        """Factor turning a count into a percentage of ``total`` (0 when empty)."""
+        return 100.0 / total if total else 0.0
 
     @staticmethod
-    def _bucket_end(start: datetime, interval: str) -> datetime:
-        if interval == "hour":
-            return start + timedelta(hours=1)
-        if interval == "day":
-            return start + timedelta(days=1)
-        raise ValueError("Unsupported interval")
+    def _bucket_width(interval: str) -> timedelta:
+        try:
+            return _BUCKET_WIDTHS[interval]
+        except KeyError:
+            raise ValueError("Unsupported interval") from None
@@ -203,7 +203,7 @@ class AssetService:
             text = request.text
             if request.use_asset_text:
                 text = text or asset.text_payload
-            if not text or not text.strip():
+            if not text or text.isspace():
                 raise ValueError("Cannot generate embedding without text payload")
             service = embeddings_service or EmbeddingsService(
                 model=request.model,
@@ -308,7 +308,7 @@ class AssetService:
             limit=request.top_k,
         )
         hits = [
-            AssetSearchHit(
+            AssetSearchHit.model_construct(
                 asset_id=asset.asset_id,
                 media_type=asset.media_type,
                 title=asset.title,
@@ -33,7 +33,7 @@ class BatchService:
         rows = await self.repo.fetch_verses_by_ids(request.verse_ids)
         unique_requested = list(dict.fromkeys(request.verse_ids))
         found_ids = {row["verse_id"] for row in rows}
-        verses = [Verse(**dict(row)) for row in rows]
+        verses = [Verse.model_construct(**dict(row)) for row in rows]
         missing = [vid for vid in unique_requested if vid not in found_ids]
         return BatchVerseResponse(verses=verses, missing_ids=missing)
 
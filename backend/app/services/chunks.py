@@ -73,7 +73,7 @@ class ChunkService:
     def _record_to_hit(row: asyncpg.Record) -> ChunkHit:
         """Map a database record to the API response model."""
 
-        return ChunkHit(
+        return ChunkHit.model_construct(
             chunk_id=row["chunk_id"],
             translation_code=row["translation_code"],
             book_number=row["book_number"],
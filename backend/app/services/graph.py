@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Tuple
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from neo4j import AsyncSession
+from neo4j import AsyncManagedTransaction, AsyncSession
 
 from backend.etl.neo4j_client import _cv_key
 
 from ..models import CanonicalVerse, GraphNeighborhood, Rendition
+from ..utils.cache import CacheManager
+
+
+# Key prefix for cached neighbourhoods; seed_graph clears it after a reseed.
+NEIGHBORHOOD_CACHE_PREFIX = "graph:cv:"
 
 
 class GraphServiceError(Exception):
@@ -23,16 +29,33 @@ class VerseNeighborhoodNotFound(GraphServiceError):
     """Raised when a verse or canonical node does not exist."""
 
 
+async def _read_data(
+    tx: AsyncManagedTransaction, query: str, params: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Run ``query`` in a managed read transaction and return its records."""
+    result = await tx.run(query, **params)
+    return await result.data()
+
+
 class GraphQueryService:
-    """Service providing Neo4j graph neighbourhood queries."""
+    """Service providing Neo4j graph neighbourhood queries.
+
+    Renditions are read with a single ``RENDITION_OF`` hop from the canonical
+    verse; the translation code comes from the ``Verse.translation`` property
+    set by the ETL rather than from a Chapter/Book/Translation traversal.
+
+    The Cypher text is held in class constants so every call sends an
+    identical string and hits the server's plan cache. Queries run through
+    ``execute_read`` so clustered deployments can route them to readers.
+
+    Given a cache, neighbourhoods are memoised by canonical verse key: both
+    lookups resolve to the same CV node, and verse text only changes when
+    the graph is reseeded.
+    """
 
     CYPHER_BY_CVK: str = (
         "MATCH (cv:CV {cvk: $cvk})\n"
-        "OPTIONAL MATCH (cv)<-[:RENDITION_OF]-(v:Verse)"
-        "<-[:HAS_VERSE]-(ch:Chapter)<-[:HAS_CHAPTER]-(b:Book)"
-        "<-[:HAS_BOOK]-(t:Translation)\n"
-        "WITH cv, v, t\n"
-        "ORDER BY t.code\n"
+        "OPTIONAL MATCH (cv)<-[:RENDITION_OF]-(v:Verse)\n"
         "RETURN cv.cvk AS cvk,\n"
         "       cv.book_number AS book_number,\n"
         "       cv.chapter_number AS chapter_number,\n"
@@ -40,7 +63,7 @@ class GraphQueryService:
         "       cv.suffix AS suffix,\n"
         "       collect(CASE WHEN v IS NULL THEN NULL ELSE {\n"
         "           verse_id: v.verse_id,\n"
-        "           translation: t.code,\n"
+        "           translation: v.translation,\n"
         "           reference: v.reference,\n"
         "           text: v.text\n"
         "       } END) AS renditions"
@@ -48,11 +71,7 @@ class GraphQueryService:
 
     CYPHER_BY_VERSE_ID: str = (
         "MATCH (v:Verse {verse_id: $verse_id})-[:RENDITION_OF]->(cv:CV)\n"
-        "OPTIONAL MATCH (cv)<-[:RENDITION_OF]-(w:Verse)"
-        "<-[:HAS_VERSE]-(ch:Chapter)<-[:HAS_CHAPTER]-(b:Book)"
-        "<-[:HAS_BOOK]-(t:Translation)\n"
-        "WITH cv, w, t\n"
-        "ORDER BY t.code\n"
+        "OPTIONAL MATCH (cv)<-[:RENDITION_OF]-(w:Verse)\n"
         "RETURN cv.cvk AS cvk,\n"
         "       cv.book_number AS book_number,\n"
         "       cv.chapter_number AS chapter_number,\n"
@@ -60,20 +79,31 @@ class GraphQueryService:
         "       cv.suffix AS suffix,\n"
         "       collect(CASE WHEN w IS NULL THEN NULL ELSE {\n"
         "           verse_id: w.verse_id,\n"
-        "           translation: t.code,\n"
+        "           translation: w.translation,\n"
         "           reference: w.reference,\n"
         "           text: w.text\n"
         "       } END) AS renditions"
     )
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        cache: Optional[CacheManager] = None,
+        cache_ttl: int = 0,
+    ) -> None:
         self._session = session
+        self._cache = cache
+        self._cache_ttl = cache_ttl
 
     async def neighborhood_by_cvk(self, cvk: str) -> GraphNeighborhood:
         """Return the verse neighbourhood for a canonical verse key."""
         normalized_cvk = self._normalize_cvk(cvk)
-        records = await self._run(self.CYPHER_BY_CVK, {"cvk": normalized_cvk})
-        result = self._build_neighborhood(records)
+        result = await self._cached(normalized_cvk)
+        if result is None:
+            records = await self._run(self.CYPHER_BY_CVK, {"cvk": normalized_cvk})
+            result = self._build_neighborhood(records)
+            await self._remember(result)
         return result
 
     async def neighborhood_for_translation_verse(
@@ -81,17 +111,32 @@ class GraphQueryService:
     ) -> GraphNeighborhood:
         """Return verse neighbourhood for a translation-specific verse."""
         verse_id, expected_cvk = self._compose_verse_id(translation, verse_fragment)
-        records = await self._run(self.CYPHER_BY_VERSE_ID, {"verse_id": verse_id})
-        result = self._build_neighborhood(records)
-        if result.canonical.cvk != expected_cvk:
-            raise VerseNeighborhoodNotFound(verse_id)
-        if not any(r.translation.upper() == translation.upper() for r in result.renditions):
+        result = await self._cached(expected_cvk)
+        if result is None:
+            records = await self._run(self.CYPHER_BY_VERSE_ID, {"verse_id": verse_id})
+            result = self._build_neighborhood(records)
+            if result.canonical.cvk == expected_cvk:
+                await self._remember(result)
+        wanted = translation.upper()
+        if result.canonical.cvk != expected_cvk or not any(
+            r.translation.upper() == wanted for r in result.renditions
+        ):
             raise VerseNeighborhoodNotFound(verse_id)
         return result
 
+    async def _cached(self, cvk: str) -> Optional[GraphNeighborhood]:
+        if self._cache is None or self._cache_ttl <= 0:
+            return None
+        return await self._cache.get(f"{NEIGHBORHOOD_CACHE_PREFIX}{cvk}")
+
+    async def _remember(self, neighborhood: GraphNeighborhood) -> None:
+        if self._cache is None or self._cache_ttl <= 0:
+            return
+        key = f"{NEIGHBORHOOD_CACHE_PREFIX}{neighborhood.canonical.cvk}"
+        await self._cache.set(key, neighborhood, ttl=self._cache_ttl)
+
     async def _run(self, query: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
-        result = await self._session.run(query, **params)
-        return await result.data()
+        return await self._session.execute_read(_read_data, query, params)
 
     def _build_neighborhood(self, records: Iterable[Dict[str, Any]]) -> GraphNeighborhood:
         first = next(iter(records), None)
@@ -99,7 +144,7 @@ class GraphQueryService:
             raise VerseNeighborhoodNotFound("neighborhood")
 
         try:
-            canonical = CanonicalVerse(
+            canonical = CanonicalVerse.model_construct(
                 cvk=first["cvk"],
                 book_number=int(first["book_number"]),
                 chapter_number=int(first["chapter_number"]),
@@ -109,22 +154,19 @@ class GraphQueryService:
         except (KeyError, TypeError, ValueError) as exc:
             raise GraphServiceError("Malformed Neo4j response") from exc
 
-        renditions_payload = [
-            payload
-            for payload in first.get("renditions", [])
-            if payload and payload.get("verse_id")
-        ]
         renditions = [
-            Rendition(
+            Rendition.model_construct(
                 verse_id=payload["verse_id"],
                 translation=payload["translation"],
                 reference=payload.get("reference", ""),
                 text=payload.get("text", ""),
             )
-            for payload in renditions_payload
+            for payload in first.get("renditions") or ()
+            if payload and payload.get("verse_id")
         ]
-        renditions.sort(key=lambda rendition: rendition.translation)
-        return GraphNeighborhood(canonical=canonical, renditions=renditions)
+        # Ordered here rather than in Cypher so Neo4j can stream the collect()
+        renditions.sort(key=attrgetter("translation"))
+        return GraphNeighborhood.model_construct(canonical=canonical, renditions=renditions)
 
     def _normalize_cvk(self, cvk: str) -> str:
         parts = cvk.strip().split(":")
@@ -12,6 +12,8 @@ from ..models import GraphExpansion, Rendition
 class GraphExpansionService:
     """Service responsible for fetching parallel verse renditions."""
 
+    __slots__ = ("_session",)
+
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
@@ -61,7 +63,7 @@ class GraphExpansionService:
             if limit is not None and limit >= 0:
                 renditions_raw = renditions_raw[:limit]
             renditions = [
-                Rendition(
+                Rendition.model_construct(
                     verse_id=item["verse_id"],
                     translation=item["translation"],
                     reference=item.get("reference", ""),
@@ -70,7 +72,7 @@ class GraphExpansionService:
                 for item in renditions_raw
                 if item.get("verse_id")
             ]
-            expansions[record["source"]] = GraphExpansion(
+            expansions[record["source"]] = GraphExpansion.model_construct(
                 verse_id=record["source"],
                 cvk=record.get("cvk"),
                 renditions=renditions,
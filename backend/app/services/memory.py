@@ -12,6 +12,8 @@ from __future__ import annotations
 from typing import List, Optional
 
 import asyncpg
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
 from ..models import (
     SessionCitation,
@@ -22,6 +24,9 @@ from ..models import (
     SessionMessageUpdate,
 )
 from ..repositories.memory import SessionMemoryRepository
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 class SessionMemoryService:
@@ -31,11 +36,35 @@ class SessionMemoryService:
         conn: An :class:`asyncpg.Connection` bound to the current request
             context. The connection is reused across repository calls so that a
             single transactional scope can be established where required.
+        redis: Optional Redis client holding each session's message count,
+            used to answer requests for pages past the end without a query.
+        count_ttl: Seconds an idle session's counter is kept in Redis.
+        namespace: Prefix applied to the counter keys.
+
+    The counter lives in a Redis hash per session and is only ever adjusted
+    atomically: writes bump ``pending`` before touching Postgres, then adjust
+    ``total`` (or drop it on a clear) and bump ``version`` once they finish.
+    ``total`` is trusted only while ``counted`` is set, which happens when a
+    total read from Postgres is stored. That store is skipped when any write
+    started or finished since the counter was read, so it can never overwrite
+    a newer count.
     """
 
-    def __init__(self, conn: asyncpg.Connection) -> None:
+    __slots__ = ("_conn", "_repo", "_redis", "_count_ttl", "_namespace")
+
+    def __init__(
+        self,
+        conn: asyncpg.Connection,
+        *,
+        redis: Optional[Redis] = None,
+        count_ttl: int = 0,
+        namespace: str = "",
+    ) -> None:
         self._conn = conn
         self._repo = SessionMemoryRepository(conn)
+        self._redis = redis if count_ttl > 0 else None
+        self._count_ttl = count_ttl
+        self._namespace = namespace
 
     async def append_message(
         self,
@@ -62,17 +91,23 @@ class SessionMemoryService:
             metadata=payload.metadata,
             citations=payload.citations,
         )
-        async with self._conn.transaction():
-            message = await self._repo.insert_message(
-                session_id=create_payload.session_id,
-                role=create_payload.role,
-                content=create_payload.content,
-                metadata=create_payload.metadata,
-            )
-            citations: List[SessionCitation] = await self._repo.add_citations(
-                message.message_id,
-                create_payload.citations,
-            )
+        await self._begin_count_write(session_id)
+        added = 0
+        try:
+            async with self._conn.transaction():
+                message = await self._repo.insert_message(
+                    session_id=create_payload.session_id,
+                    role=create_payload.role,
+                    content=create_payload.content,
+                    metadata=create_payload.metadata,
+                )
+                citations: List[SessionCitation] = await self._repo.add_citations(
+                    message.message_id,
+                    create_payload.citations,
+                )
+            added = 1
+        finally:
+            await self._end_count_write(session_id, delta=added)
         return message.model_copy(update={"citations": citations})
 
     async def list_session_context(
@@ -96,12 +131,25 @@ class SessionMemoryService:
             messages and pagination metadata.
         """
 
-        items = await self._repo.list_messages(
+        counter = await self._read_counter(session_id)
+        if counter is not None:
+            cached_total = _cached_total(counter)
+            if offset and cached_total is not None and offset >= cached_total:
+                return SessionContextResponse.model_construct(
+                    session_id=session_id,
+                    total=cached_total,
+                    limit=limit,
+                    offset=offset,
+                    items=[],
+                )
+
+        items, total = await self._repo.list_messages(
             session_id,
             limit=limit,
             offset=offset,
         )
-        total = await self._repo.count_messages(session_id)
+        if counter is not None:
+            await self._store_count(session_id, total, version=counter[1])
         return SessionContextResponse(
             session_id=session_id,
             total=total,
@@ -197,7 +245,12 @@ class SessionMemoryService:
         message = await self._repo.get_message(message_id)
         if not message or message.session_id != session_id:
             raise LookupError(f"message {message_id} not found for session {session_id}")
-        deleted = await self._repo.delete_message(message_id)
+        await self._begin_count_write(session_id)
+        deleted = 0
+        try:
+            deleted = await self._repo.delete_message(message_id)
+        finally:
+            await self._end_count_write(session_id, delta=-deleted)
         if deleted == 0:  # pragma: no cover - defensive
             raise LookupError(f"message {message_id} not found for session {session_id}")
 
@@ -211,4 +264,82 @@ class SessionMemoryService:
             The number of messages deleted across the session.
         """
 
-        return await self._repo.clear_session(session_id)
+        await self._begin_count_write(session_id)
+        try:
+            deleted = await self._repo.clear_session(session_id)
+        finally:
+            await self._end_count_write(session_id, reset=True)
+        return deleted
+
+    def _count_key(self, session_id: str) -> str:
+        return f"{self._namespace}:session_count:{session_id}"
+
+    async def _read_counter(self, session_id: str) -> Optional[List[Optional[bytes]]]:
+        """Return ``[pending, version, total, counted]`` or ``None`` without Redis."""
+
+        if self._redis is None:
+            return None
+        try:
+            return await self._redis.hmget(
+                self._count_key(session_id), "pending", "version", "total", "counted"
+            )
+        except RedisError as exc:
+            logger.warning("Session count read failed", extra={"error": str(exc)})
+            return None
+
+    async def _store_count(
+        self, session_id: str, total: int, *, version: Optional[bytes]
+    ) -> None:
+        """Store a total read from Postgres unless a write raced the read."""
+
+        key = self._count_key(session_id)
+        try:
+            pending, current = await self._redis.hmget(key, "pending", "version")
+            if int(pending or 0) > 0 or int(current or 0) != int(version or 0):
+                return
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping={"total": total, "counted": 1})
+                pipe.expire(key, self._count_ttl)
+                await pipe.execute()
+        except RedisError as exc:
+            logger.warning("Session count store failed", extra={"error": str(exc)})
+
+    async def _begin_count_write(self, session_id: str) -> None:
+        if self._redis is None:
+            return
+        key = self._count_key(session_id)
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.hincrby(key, "pending", 1)
+                pipe.expire(key, self._count_ttl)
+                await pipe.execute()
+        except RedisError as exc:
+            logger.warning("Session count update failed", extra={"error": str(exc)})
+
+    async def _end_count_write(
+        self, session_id: str, *, delta: int = 0, reset: bool = False
+    ) -> None:
+        if self._redis is None:
+            return
+        key = self._count_key(session_id)
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.hincrby(key, "pending", -1)
+                pipe.hincrby(key, "version", 1)
+                if reset:
+                    pipe.hdel(key, "total", "counted")
+                elif delta:
+                    pipe.hincrby(key, "total", delta)
+                pipe.expire(key, self._count_ttl)
+                await pipe.execute()
+        except RedisError as exc:
+            logger.warning("Session count update failed", extra={"error": str(exc)})
+
+
+def _cached_total(counter: List[Optional[bytes]]) -> Optional[int]:
+    """Return the counted total, or ``None`` while a write is still in flight."""
+
+    pending, _, total, counted = counter
+    if not counted or total is None or int(pending or 0) > 0:
+        return None
+    return int(total)
@@ -19,9 +19,13 @@ from .graph_expansion import GraphExpansionService
 from .search_api import SearchApiService
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FusionStrategy:
-    """Runtime fusion strategy resolved from the manifest."""
+    """Runtime fusion strategy resolved from the manifest.
+
+    A flat snapshot of the nested manifest models, rebuilt only when the
+    manifest generation changes, so per-request reads are slot lookups.
+    """
 
     method: str
     k_rrf: int
@@ -64,6 +68,8 @@ def resolve_fusion_strategy() -> FusionStrategy:
 class RetrievalOrchestrator:
     """Coordinate ranked retrieval by combining search and graph services."""
 
+    __slots__ = ("_search", "_graph", "_fusion")
+
     def __init__(
         self,
         search_service: SearchApiService,
@@ -96,7 +102,7 @@ class RetrievalOrchestrator:
         for hit in search_response.items:
             boosted_hit = self._apply_graph_boost(hit, expansions)
             items.append(
-                RetrievalHit(
+                RetrievalHit.model_construct(
                     hit=boosted_hit,
                     parallels=expansions.get(hit.verse_id),
                 )
@@ -114,7 +120,9 @@ class RetrievalOrchestrator:
                 applied=graph_enabled,
             ),
         )
-        return RetrievalResponse(total=len(items), items=items, fusion=fusion_info)
+        return RetrievalResponse.model_construct(
+            total=len(items), items=items, fusion=fusion_info
+        )
 
     def _apply_graph_boost(
         self,
@@ -130,9 +138,7 @@ class RetrievalOrchestrator:
             return hit
         boost = self._fusion.graph_weight * len(expansion.renditions)
         boosted_score = round(hit.score + boost, 4)
-        payload = hit.model_dump()
-        payload["score"] = boosted_score
-        return SearchHit(**payload)
+        return hit.model_copy(update={"score": boosted_score})
 
     def _build_hybrid_query(self, query: RetrievalQuery) -> RetrievalQuery:
         """Normalise query parameters with manifest-backed defaults."""
@@ -19,6 +19,8 @@ from ..repositories.search import SearchRepository
 class SearchApiService:
     """Encapsulates validation and repository coordination for search."""
 
+    __slots__ = ("_repo",)
+
     def __init__(
         self,
         conn: asyncpg.Connection,
@@ -52,8 +54,8 @@ class SearchApiService:
             limit=limit,
             offset=offset,
         )
-        hits = [SearchHit(**item) for item in items]
-        return SearchResponse(total=total, items=hits)
+        hits = [SearchHit.model_construct(**item) for item in items]
+        return SearchResponse.model_construct(total=total, items=hits)
 
     async def vector_search(self, body: VectorQuery) -> SearchResponse:
         """Execute vector similarity search with dimensional validation.
@@ -79,8 +81,8 @@ class SearchApiService:
             translation=body.translation,
             limit=limit,
         )
-        hits = [SearchHit(**row) for row in rows]
-        return SearchResponse(total=len(hits), items=hits)
+        hits = [SearchHit.model_construct(**row) for row in rows]
+        return SearchResponse.model_construct(total=len(hits), items=hits)
 
     async def hybrid_search(self, body: HybridQuery) -> SearchResponse:
         """Execute hybrid search with validation rules.
@@ -114,5 +116,5 @@ class SearchApiService:
             k_rrf=body.k_rrf,
             top_k=top_k,
         )
-        hits = [SearchHit(**row) for row in rows]
-        return SearchResponse(total=len(hits), items=hits)
+        hits = [SearchHit.model_construct(**row) for row in rows]
+        return SearchResponse.model_construct(total=len(hits), items=hits)
@@ -2,17 +2,53 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+import orjson
+
 try:
     from opentelemetry import trace
 except ModuleNotFoundError:  # pragma: no cover - optional dependency
     trace = None  # type: ignore[assignment]
 
 
+# UTC_Z renders the record timestamp as "...Z"; NON_STR_KEYS keeps extras
+# with int or enum keys serialisable as they were under the stdlib encoder.
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+# Standard LogRecord attributes; anything else on a record came in via ``extra``.
+_RESERVED_LOG_ATTRS: frozenset[str] = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "taskName",
+    }
+)
+# Attribute count of a record created without ``extra``; anything longer was
+# given extras and needs the scan below.
+_BASE_RECORD_ATTR_COUNT = len(logging.makeLogRecord({}).__dict__)
+
+
 class JsonFormatter(logging.Formatter):
     """Simple JSON formatter emitting structured log lines."""
 
@@ -24,9 +60,7 @@ class JsonFormatter(logging.Formatter):
         """Format the log record as a JSON payload."""
 
         base: Dict[str, Any] = {
-            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc)
-            .isoformat()
-            .replace("+00:00", "Z"),
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -48,35 +82,16 @@ class JsonFormatter(logging.Formatter):
             base["exception"] = self.formatException(record.exc_info)
 
         # Include any extra structured attributes that were passed via logger.bind
-        for key, value in record.__dict__.items():
-            if key.startswith("_"):
-                continue
-            if key in {
-                "name",
-                "msg",
-                "args",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-            }:
-                continue
-            base.setdefault("extra", {})[key] = value
-
-        return json.dumps(base, default=_json_default)
+        if len(record.__dict__) > _BASE_RECORD_ATTR_COUNT:
+            extras = {
+                key: value
+                for key, value in record.__dict__.items()
+                if not key.startswith("_") and key not in _RESERVED_LOG_ATTRS
+            }
+            if extras:
+                base["extra"] = extras
+
+        return orjson.dumps(base, default=_json_default, option=_ORJSON_OPTIONS).decode("utf-8")
 
 
 def _json_default(value: Any) -> Any:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+import zlib
 from pathlib import Path
 from threading import Lock
 from typing import Dict, Literal, Optional
@@ -52,7 +52,8 @@ class ManifestConfig(BaseModel):
 
 
 _manifest_cache: ManifestConfig | None = None
-_manifest_mtime: float | None = None
+_manifest_mtime: int | None = None
+_manifest_crc: int | None = None
 _manifest_path: Path | None = None
 _manifest_generation: int = 0
 _manifest_lock = Lock()
@@ -63,28 +64,41 @@ def load_manifest(path: Optional[str] = None, *, force_reload: bool = False) ->
 
     manifest_path = Path(path or settings.MANIFEST_PATH)
 
-    global _manifest_cache, _manifest_mtime, _manifest_path, _manifest_generation
+    global _manifest_cache, _manifest_mtime, _manifest_crc, _manifest_path, _manifest_generation
 
     with _manifest_lock:
-        if not force_reload and _manifest_cache is not None and _manifest_path == manifest_path:
-            try:
-                current_mtime = manifest_path.stat().st_mtime
-            except FileNotFoundError:
-                # Bubble the error so callers can handle missing manifests explicitly.
-                raise
-            if _manifest_mtime == current_mtime:
-                return _manifest_cache
-        try:
-            current_mtime = manifest_path.stat().st_mtime
-            with manifest_path.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
-        except FileNotFoundError:
-            raise
-
-        config = ManifestConfig.model_validate(data)
+        # One stat per call; FileNotFoundError bubbles so callers can handle
+        # missing manifests explicitly. Nanosecond mtimes catch rewrites that
+        # land within the float timestamp's resolution.
+        current_mtime = manifest_path.stat().st_mtime_ns
+        if (
+            not force_reload
+            and _manifest_cache is not None
+            and _manifest_path == manifest_path
+            and _manifest_mtime == current_mtime
+        ):
+            return _manifest_cache
+
+        raw = manifest_path.read_bytes()
+        crc = zlib.crc32(raw)
+        if (
+            not force_reload
+            and _manifest_cache is not None
+            and _manifest_path == manifest_path
+            and _manifest_crc == crc
+        ):
+            # Touched but unchanged (e.g. a redeploy rewrote the file): keep
+            # the parsed config and generation so dependents are not rebuilt.
+            _manifest_mtime = current_mtime
+            return _manifest_cache
+
+        # Parse and validate in one pass inside pydantic-core, straight from
+        # the raw bytes; no intermediate dict is built for the whole file.
+        config = ManifestConfig.model_validate_json(raw)
         _manifest_cache = config
         _manifest_path = manifest_path
         _manifest_mtime = current_mtime
+        _manifest_crc = crc
         _manifest_generation += 1
         return config
 
@@ -92,10 +106,11 @@ def load_manifest(path: Optional[str] = None, *, force_reload: bool = False) ->
 def reset_manifest_cache() -> None:
     """Clear the manifest cache forcing the next access to reload from disk."""
 
-    global _manifest_cache, _manifest_mtime, _manifest_path, _manifest_generation
+    global _manifest_cache, _manifest_mtime, _manifest_crc, _manifest_path, _manifest_generation
     with _manifest_lock:
         _manifest_cache = None
         _manifest_mtime = None
+        _manifest_crc = None
         _manifest_path = None
         _manifest_generation += 1
 
@@ -84,10 +84,27 @@ def observe_request(method: str, path: str, status_code: int, duration: float) -
         REQUEST_ERRORS.labels(method=method, path=path, status=status_code).inc()
 
 
-def metrics_response() -> tuple[bytes, str]:
-    """Return serialized Prometheus metrics payload and content type."""
+# Seconds a generated exposition payload is reused for repeated scrapes.
+METRICS_CACHE_TTL = 1.0
+
+_metrics_cache: tuple[float, bytes] | None = None
 
+
+def metrics_response() -> tuple[bytes, str]:
+    """Return serialized Prometheus metrics payload and content type.
+
+    ``generate_latest`` walks every collector, so the payload is reused for
+    ``METRICS_CACHE_TTL`` seconds to absorb near-simultaneous scrapes. The
+    function is CPU-bound; async callers should run it in a threadpool.
+    """
+
+    global _metrics_cache
+    now = time.monotonic()
+    cached = _metrics_cache
+    if cached is not None and now < cached[0]:
+        return cached[1], CONTENT_TYPE_LATEST
     payload = generate_latest()
+    _metrics_cache = (now + METRICS_CACHE_TTL, payload)
     return payload, CONTENT_TYPE_LATEST
 
 
@@ -0,0 +1,40 @@
+"""Response classes for returning pre-validated Pydantic models."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+
+def _dump_json_bytes(model: BaseModel) -> bytes:
+    return model.model_dump_json().encode("utf-8")
+
+
+class PydanticJSONResponse(ORJSONResponse):
+    """JSON response that serialises Pydantic models in pydantic-core.
+
+    Returning this response from a route bypasses FastAPI's response_model
+    round-trip (dump, re-validate, ``jsonable_encoder``, encode) and
+    encodes the model exactly once with ``model_dump_json``. Routes should
+    keep ``response_model=`` so the OpenAPI schema is unchanged.
+
+    For large payloads, ``await PydanticJSONResponse.create(model)`` runs
+    the encode in the threadpool so the event loop keeps serving other
+    requests meanwhile.
+    """
+
+    @classmethod
+    async def create(cls, content: BaseModel, status_code: int = 200) -> "PydanticJSONResponse":
+        """Build a response whose body is serialised off the event loop."""
+        body = await run_in_threadpool(_dump_json_bytes, content)
+        return cls(body, status_code=status_code)
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        if isinstance(content, BaseModel):
+            return _dump_json_bytes(content)
+        return super().render(content)
@@ -36,7 +36,7 @@ Example Usage:
 """
 
 from typing import Dict, Any, Iterable, List, Set, cast, LiteralString
-from neo4j import GraphDatabase, Driver, Session
+from neo4j import GraphDatabase, Driver, ManagedTransaction, Session
 
 
 def _cv_key(
@@ -57,6 +57,81 @@ def _cv_key(
     return f"{book_number}:{chapter_number}:{verse_number}:{suffix or ''}"
 
 
+# Cypher text lives at module level: every batch sends byte-identical query
+# text, which keeps it in the server-side plan cache.
+_SCHEMA_CYPHER: tuple[LiteralString, ...] = (
+    "CREATE CONSTRAINT translation_code IF NOT EXISTS FOR (t:Translation) REQUIRE t.code IS UNIQUE",
+    "CREATE CONSTRAINT canon_book_num IF NOT EXISTS FOR (cb:CanonBook) REQUIRE cb.number IS UNIQUE",
+    "CREATE CONSTRAINT book_by_txnum IF NOT EXISTS FOR (b:Book) REQUIRE (b.translation, b.number) IS UNIQUE",
+    "CREATE CONSTRAINT chapter_by_triplet IF NOT EXISTS FOR (c:Chapter) REQUIRE (c.translation, c.book_number, c.number) IS UNIQUE",
+    "CREATE CONSTRAINT verse_by_id IF NOT EXISTS FOR (v:Verse) REQUIRE v.verse_id IS UNIQUE",
+    "CREATE CONSTRAINT cv_by_key IF NOT EXISTS FOR (cv:CV) REQUIRE cv.cvk IS UNIQUE",
+    "CREATE INDEX verse_ref IF NOT EXISTS FOR (v:Verse) ON (v.reference)",
+    "CREATE INDEX book_name IF NOT EXISTS FOR (b:Book) ON (b.name)",
+)
+
+_MERGE_BATCH_CYPHER: LiteralString = """
+UNWIND $rows AS r
+// Translation node
+MERGE (t:Translation {code: r.translation})
+
+// Canonical book and translated book
+MERGE (cb:CanonBook {number: r.book_number})
+  ON CREATE SET cb.testament = r.testament
+  ON MATCH  SET cb.testament = coalesce(cb.testament, r.testament)
+
+MERGE (tb:Book {translation: r.translation, number: r.book_number})
+  ON CREATE SET tb.name = r.book_name
+  ON MATCH  SET tb.name = r.book_name
+
+MERGE (t)-[:HAS_BOOK]->(tb)
+MERGE (tb)-[:TRANSLATES]->(cb)
+
+// Chapter (translation-scoped)
+MERGE (ch:Chapter {
+    translation: r.translation,
+    book_number: r.book_number,
+    number: r.chapter_number
+})
+MERGE (tb)-[:HAS_CHAPTER]->(ch)
+
+// Canonical verse node (shared across translations)
+MERGE (cv:CV {cvk: r.cvk})
+  ON CREATE SET
+    cv.book_number    = r.book_number,
+    cv.chapter_number = r.chapter_number,
+    cv.verse_number   = r.verse_number,
+    cv.suffix         = r.suffix
+
+// Verse rendition (translation-specific)
+MERGE (v:Verse {verse_id: r.verse_id})
+  ON CREATE SET v.translation = r.translation,
+                v.reference   = r.reference,
+                v.text        = r.text
+  ON MATCH  SET v.translation = r.translation,
+                v.reference   = r.reference,
+                v.text        = r.text
+
+MERGE (ch)-[:HAS_VERSE]->(v)
+MERGE (v)-[:RENDITION_OF]->(cv)
+"""
+
+_LINK_PARALLELS_CYPHER: LiteralString = """
+UNWIND $kv AS k
+MATCH (cv:CV {cvk: k})
+WITH cv
+MATCH (cv)<-[:RENDITION_OF]-(a:Verse),
+      (cv)<-[:RENDITION_OF]-(b:Verse)
+WHERE id(a) < id(b)
+MERGE (a)-[:PARALLEL_TO {basis:'cvk'}]->(b)
+"""
+
+
+def _run_write(tx: ManagedTransaction, query: str, **params: Any) -> None:
+    """Run a write query inside a managed transaction and consume the result."""
+    tx.run(cast(LiteralString, query), **params).consume()
+
+
 class Neo4jClient:
     """
     Synchronous Neo4j client for biblical text graph operations.
@@ -111,21 +186,9 @@ class Neo4jClient:
         """
         self._drop_legacy_conflicting()
 
-        constraints_and_indexes = [
-            "CREATE CONSTRAINT translation_code IF NOT EXISTS FOR (t:Translation) REQUIRE t.code IS UNIQUE",
-            "CREATE CONSTRAINT canon_book_num IF NOT EXISTS FOR (cb:CanonBook) REQUIRE cb.number IS UNIQUE",
-            "CREATE CONSTRAINT book_by_txnum IF NOT EXISTS FOR (b:Book) REQUIRE (b.translation, b.number) IS UNIQUE",
-            "CREATE CONSTRAINT chapter_by_triplet IF NOT EXISTS FOR (c:Chapter) REQUIRE (c.translation, c.book_number, c.number) IS UNIQUE",
-            "CREATE CONSTRAINT verse_by_id IF NOT EXISTS FOR (v:Verse) REQUIRE v.verse_id IS UNIQUE",
-            "CREATE CONSTRAINT cv_by_key IF NOT EXISTS FOR (cv:CV) REQUIRE cv.cvk IS UNIQUE",
-            "CREATE INDEX verse_ref IF NOT EXISTS FOR (v:Verse) ON (v.reference)",
-            "CREATE INDEX book_name IF NOT EXISTS FOR (b:Book) ON (b.name)",
-        ]
-
         with self.driver.session() as session:
-            for cypher_stmt in constraints_and_indexes:
-                # Cast to LiteralString to satisfy neo4j type checker
-                session.run(cast(LiteralString, cypher_stmt))
+            for cypher_stmt in _SCHEMA_CYPHER:
+                session.run(cypher_stmt)
 
     def _drop_legacy_conflicting(self) -> None:
         """
@@ -184,8 +247,8 @@ class Neo4jClient:
             Use these for subsequent parallel linking operations.
 
         Performance:
-            Processes batches of ~5,000 verses efficiently using UNWIND.
-            All operations are idempotent (safe to rerun).
+            Sends one UNWIND query per 1,000 rows, each in its own managed
+            write transaction. All operations are idempotent (safe to rerun).
         """
         rows: List[Dict[str, Any]] = []
         cvks: Set[str] = set()
@@ -216,54 +279,13 @@ class Neo4jClient:
                 "cvk": cvk,
             })
 
-        cypher = """
-        UNWIND $rows AS r
-        // Translation node
-        MERGE (t:Translation {code: r.translation})
-
-        // Canonical book and translated book
-        MERGE (cb:CanonBook {number: r.book_number})
-          ON CREATE SET cb.testament = r.testament
-          ON MATCH  SET cb.testament = coalesce(cb.testament, r.testament)
-
-        MERGE (tb:Book {translation: r.translation, number: r.book_number})
-          ON CREATE SET tb.name = r.book_name
-          ON MATCH  SET tb.name = r.book_name
-
-        MERGE (t)-[:HAS_BOOK]->(tb)
-        MERGE (tb)-[:TRANSLATES]->(cb)
-
-        // Chapter (translation-scoped)
-        MERGE (ch:Chapter {
-            translation: r.translation,
-            book_number: r.book_number,
-            number: r.chapter_number
-        })
-        MERGE (tb)-[:HAS_CHAPTER]->(ch)
-
-        // Canonical verse node (shared across translations)
-        MERGE (cv:CV {cvk: r.cvk})
-          ON CREATE SET
-            cv.book_number    = r.book_number,
-            cv.chapter_number = r.chapter_number,
-            cv.verse_number   = r.verse_number,
-            cv.suffix         = r.suffix
-
-        // Verse rendition (translation-specific)
-        MERGE (v:Verse {verse_id: r.verse_id})
-          ON CREATE SET v.translation = r.translation,
-                        v.reference   = r.reference,
-                        v.text        = r.text
-          ON MATCH  SET v.translation = r.translation,
-                        v.reference   = r.reference,
-                        v.text        = r.text
-
-        MERGE (ch)-[:HAS_VERSE]->(v)
-        MERGE (v)-[:RENDITION_OF]->(cv)
-        """
-
+        # One UNWIND round-trip per sub-batch, each in a managed write
+        # transaction so transient cluster errors are retried by the driver.
+        # Sub-batching keeps bolt frames and transaction state bounded.
+        CHUNK_SIZE = 1000
         with self._session() as session:
-            session.run(cypher, rows=rows)
+            for i in range(0, len(rows), CHUNK_SIZE):
+                session.execute_write(_run_write, _MERGE_BATCH_CYPHER, rows=rows[i : i + CHUNK_SIZE])
 
         return cvks
 
@@ -292,19 +314,9 @@ class Neo4jClient:
         if not unique_keys:
             return
 
-        cypher = """
-        UNWIND $kv AS k
-        MATCH (cv:CV {cvk: k})
-        WITH cv
-        MATCH (cv)<-[:RENDITION_OF]-(a:Verse),
-              (cv)<-[:RENDITION_OF]-(b:Verse)
-        WHERE id(a) < id(b)
-        MERGE (a)-[:PARALLEL_TO {basis:'cvk'}]->(b)
-        """
-
         # Split into chunks to avoid oversized UNWIND payloads
         CHUNK_SIZE = 2000
         with self._session() as session:
             for i in range(0, len(unique_keys), CHUNK_SIZE):
                 chunk = unique_keys[i : i + CHUNK_SIZE]
-                session.run(cypher, kv=chunk)
+                session.run(_LINK_PARALLELS_CYPHER, kv=chunk)
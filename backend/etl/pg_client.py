@@ -184,6 +184,8 @@ class PgClient:
 
         Note:
             - Uses a named server-side cursor to minimize memory footprint
+            - Each batch is a single FETCH of batch_size rows, so batch_size is
+              also the cursor's fetch window; nothing is double-buffered
             - Results are consistently ordered for reproducible processing
             - Connection is held for the duration of iteration
         """
@@ -218,31 +220,16 @@ class PgClient:
         async with self.pool.acquire() as conn:
             # Server-side cursor for memory-efficient streaming
             async with conn.transaction():
+                # The whole table is read, so plan for total rather than
+                # first-row cost (default fraction is 0.1)
+                await conn.execute("SET LOCAL cursor_tuple_fraction = 1.0")
                 cursor = await conn.cursor(sql)
-                batch: List[Dict[str, Any]] = []
 
-                async for record in cursor:
+                # Each FETCH returns exactly one batch from the server; no
+                # second client-side buffer or per-row iteration.
+                while records := await cursor.fetch(batch_size):
                     # Convert asyncpg.Record to dict for easier consumption
-                    verse_dict = {
-                        "verse_id": record["verse_id"],
-                        "translation_code": record["translation_code"],
-                        "book_number": record["book_number"],
-                        "chapter_number": record["chapter_number"],
-                        "verse_number": record["verse_number"],
-                        "suffix": record["suffix"],
-                        "text": record["text"],
-                        "book_name": record["book_name"],
-                        "testament": record["testament"],
-                    }
-                    batch.append(verse_dict)
-
-                    if len(batch) >= batch_size:
-                        yield batch
-                        batch = []
-
-                # Yield remaining verses if any
-                if batch:
-                    yield batch
+                    yield [dict(record) for record in records]
 
     async def list_distinct_references(self) -> list[str]:
         """
@@ -21,12 +21,16 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
+import contextlib
 import os
 import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Set
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 
+import orjson
 from dotenv import load_dotenv
 from opentelemetry import trace
 from prometheus_client import Counter, Histogram, start_http_server
@@ -37,6 +41,8 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from backend.app.config import Settings
+from backend.app.services.graph import NEIGHBORHOOD_CACHE_PREFIX
+from backend.app.utils.cache import CacheManager
 from backend.app.utils.logging import configure_logging, get_logger
 from backend.app.utils.observability import configure_tracing
 
@@ -70,6 +76,11 @@ NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "password")
 MANIFEST_JSON = os.getenv("MANIFEST_JSON", "./manifest.json")
 BATCH_SIZE = int(os.getenv("GRAPH_BATCH_SIZE", "5000"))
 LINK_MODE = os.getenv("GRAPH_LINK_MODE", "per-batch")
+# Dedicated Neo4j worker threads; also the number of batches merged concurrently
+NEO4J_POOL_SIZE = int(os.getenv("NEO4J_POOL_SIZE", "6"))
+# Progress is logged every N batches, or sooner if this many seconds have passed
+PROGRESS_LOG_BATCHES = int(os.getenv("GRAPH_PROGRESS_LOG_BATCHES", "10"))
+PROGRESS_LOG_SECONDS = float(os.getenv("GRAPH_PROGRESS_LOG_SECONDS", "5"))
 ETL_METRICS_ENABLED = os.getenv("ETL_METRICS_ENABLED", "true").lower() == "true"
 ETL_METRICS_PORT = int(os.getenv("ETL_METRICS_PORT", "9001"))
 
@@ -130,7 +141,7 @@ def read_manifest(path: str) -> Optional[dict]:
     p = Path(path)
     if p.exists():
         try:
-            return json.loads(p.read_text(encoding="utf-8"))
+            return orjson.loads(p.read_bytes())
         except Exception:
             return None
     return None
@@ -150,7 +161,9 @@ async def run_async(batch_size: int, link_mode: str) -> None:
 
     Performance Notes:
         - Uses async PostgreSQL with server-side cursors for streaming
-        - Neo4j operations run in thread pool to keep event loop responsive
+        - Prefetches up to two batches while the current one is written
+        - Neo4j operations run in a dedicated thread pool (NEO4J_POOL_SIZE
+          workers), with that many batches merged concurrently
         - Expected throughput: 5,000-10,000 verses/second depending on hardware
     """
     with tracer.start_as_current_span(
@@ -168,69 +181,145 @@ async def run_async(batch_size: int, link_mode: str) -> None:
 
         # Initialize async Postgres client
         async with PgClient(DATABASE_URL) as pg:
-            # Initialize sync Neo4j client (will run in thread pool)
+            # Initialize sync Neo4j client (will run in a dedicated thread pool;
+            # the driver is thread-safe and every call opens its own session)
             g = Neo4jClient(NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD)
             loop = asyncio.get_running_loop()
+            executor = ThreadPoolExecutor(max_workers=NEO4J_POOL_SIZE, thread_name_prefix="neo4j")
 
             logger.info("initializing_constraints")
-            await loop.run_in_executor(None, g.init_constraints)
+            await loop.run_in_executor(executor, g.init_constraints)
 
             total_rows = 0
-            touched_cvks: Set[str] = set()
+            # Per-batch CVK sets, unioned once for the post-link pass
+            touched_cvks: List[Set[str]] = []
 
             logger.info(
                 "starting_upserts",
-                extra={"batch_size": batch_size, "link_mode": link_mode},
+                extra={
+                    "batch_size": batch_size,
+                    "link_mode": link_mode,
+                    "workers": NEO4J_POOL_SIZE,
+                },
             )
             batch_count = 0
-
-            async for batch in pg.iter_verses(batch_size=batch_size):
-                batch_count += 1
+            rows_since_log = 0
+            last_log = time.monotonic()
+
+            # Fetch the next batches from Postgres while Neo4j writes the
+            # current one. The bounded queue caps memory at ~2 batches.
+            queue: asyncio.Queue[Optional[List[Dict[str, Any]]]] = asyncio.Queue(maxsize=2)
+
+            async def produce() -> None:
+                # Always wake the consumer; errors surface when the task is awaited.
+                try:
+                    async for fetched in pg.iter_verses(batch_size=batch_size):
+                        await queue.put(fetched)
+                except Exception:
+                    await queue.put(None)
+                    raise
+                await queue.put(None)
+
+            async def merge(batch: List[Dict[str, Any]]) -> Set[str]:
                 with tracer.start_as_current_span(
                     "seed_graph.merge_batch",
                     attributes={"batch_size": len(batch)},
                 ):
                     with ETL_BATCH_LATENCY.labels(link_mode=link_mode).time():
-                        cvks = await loop.run_in_executor(None, g.merge_batch, batch)
+                        return await loop.run_in_executor(executor, g.merge_batch, batch)
+
+            # Up to NEO4J_POOL_SIZE merges run at once, but they are finished
+            # in submission order: by the time a batch's CVKs are linked, every
+            # earlier batch has committed, so a CVK that straddles two batches
+            # is always linked once all of its renditions exist.
+            in_flight: Deque[Tuple[int, asyncio.Task[Set[str]]]] = deque()
+
+            async def finish_oldest() -> None:
+                nonlocal batch_count, total_rows, rows_since_log, last_log
+                batch_rows, task = in_flight.popleft()
+                cvks = await task
+                batch_count += 1
 
-                batch_rows = len(batch)
                 total_rows += batch_rows
                 ETL_ROWS_TOTAL.inc(batch_rows)
                 ETL_BATCHES_TOTAL.labels(link_mode=link_mode).inc()
 
-                logger.info(
-                    "batch_processed",
-                    extra={
-                        "batch_number": batch_count,
-                        "rows": batch_rows,
-                        "total_rows": total_rows,
-                    },
-                )
+                rows_since_log += batch_rows
+                now = time.monotonic()
+                if (
+                    batch_count % PROGRESS_LOG_BATCHES == 0
+                    or now - last_log >= PROGRESS_LOG_SECONDS
+                ):
+                    logger.info(
+                        "batch_processed",
+                        extra={
+                            "batch_number": batch_count,
+                            "rows": rows_since_log,
+                            "total_rows": total_rows,
+                        },
+                    )
+                    rows_since_log = 0
+                    last_log = now
 
                 if link_mode == "per-batch":
                     with tracer.start_as_current_span(
                         "seed_graph.link_parallels",
                         attributes={"cvk_count": len(cvks)},
                     ):
-                        await loop.run_in_executor(None, g.link_parallels_for_cvks, cvks)
+                        await loop.run_in_executor(executor, g.link_parallels_for_cvks, cvks)
                 else:
-                    touched_cvks.update(cvks)
-
-            if link_mode == "post" and touched_cvks:
-                logger.info(
-                    "linking_post_batches",
-                    extra={"cvk_count": len(touched_cvks)},
-                )
-                with tracer.start_as_current_span(
-                    "seed_graph.link_parallels_post",
-                    attributes={"cvk_count": len(touched_cvks)},
-                ):
-                    await loop.run_in_executor(None, g.link_parallels_for_cvks, touched_cvks)
+                    touched_cvks.append(cvks)
+
+            producer = asyncio.create_task(produce())
+            try:
+                while (batch := await queue.get()) is not None:
+                    in_flight.append((len(batch), asyncio.create_task(merge(batch))))
+                    if len(in_flight) >= NEO4J_POOL_SIZE:
+                        await finish_oldest()
+                while in_flight:
+                    await finish_oldest()
+
+                await producer
+
+                if link_mode == "post" and touched_cvks:
+                    all_cvks = set().union(*touched_cvks)
+                    logger.info(
+                        "linking_post_batches",
+                        extra={"cvk_count": len(all_cvks)},
+                    )
+                    with tracer.start_as_current_span(
+                        "seed_graph.link_parallels_post",
+                        attributes={"cvk_count": len(all_cvks)},
+                    ):
+                        await loop.run_in_executor(executor, g.link_parallels_for_cvks, all_cvks)
+            finally:
+                for _, task in in_flight:
+                    task.cancel()
+                if not producer.done():
+                    producer.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await producer
+                # Wait for merges already running in worker threads before
+                # the driver is closed underneath them
+                executor.shutdown(wait=True)
 
             # Clean shutdown
             g.close()
 
-        logger.info("seed_complete", extra={"total_rows": total_rows})
+        # The API caches neighbourhoods in Redis for GRAPH_CACHE_TTL_SECONDS;
+        # drop them so the rewritten graph is served from the next request.
+        cache = CacheManager(
+            redis_url=settings.REDIS_URL,
+            default_ttl=settings.CACHE_TTL_SECONDS,
+            max_items=settings.CACHE_MAX_ITEMS,
+            namespace=settings.CACHE_NAMESPACE,
+        )
+        await cache.invalidate(f"{NEIGHBORHOOD_CACHE_PREFIX}*")
+
+        logger.info(
+            "seed_complete",
+            extra={"batches": batch_count, "total_rows": total_rows},
+        )
 
 
 if __name__ == "__main__":
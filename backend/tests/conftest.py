@@ -12,6 +12,7 @@ Provides:
 
 import asyncio
 import logging
+import os
 from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
@@ -22,11 +23,15 @@ import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from fastapi.testclient import TestClient
 
-from backend.app.main import app
-from backend.app.config import settings
-from backend.app.db.postgres_async import get_pg
-from backend.app.db.neo4j import get_neo4j_session
-from backend.app.dependencies.cache import get_cache_manager
+# The rate limiter reads its enabled flag when the middleware stack is built,
+# so the per-fixture settings toggle below comes too late to switch it off.
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+from backend.app.main import app  # noqa: E402
+from backend.app.config import settings  # noqa: E402
+from backend.app.db.postgres_async import get_pg, get_pg_pool  # noqa: E402
+from backend.app.db.neo4j import get_neo4j_session  # noqa: E402
+from backend.app.dependencies.cache import reset_cache_manager  # noqa: E402
 
 
 # ============================================================================
@@ -501,6 +506,12 @@ def mock_neo4j_session():
     mock_session.run = AsyncMock(return_value=mock_result)
     mock_session.close = AsyncMock()
 
+    async def _execute_read(work, *args, **kwargs):
+        # Managed transactions share the session's run() mock
+        return await work(mock_session, *args, **kwargs)
+
+    mock_session.execute_read = AsyncMock(side_effect=_execute_read)
+
     return mock_session
 
 
@@ -524,7 +535,7 @@ def override_db_dependencies(mock_pg_conn, mock_neo4j_session):
     if not settings.JWT_SECRET_KEY:
         settings.JWT_SECRET_KEY = "test-secret"
     settings.REDIS_URL = ""
-    get_cache_manager.cache_clear()
+    reset_cache_manager()
 
     from backend.app.db import postgres_async
     from backend.app import main as app_main
@@ -540,7 +551,11 @@ def override_db_dependencies(mock_pg_conn, mock_neo4j_session):
     def mock_get_neo4j():
         yield mock_neo4j_session
 
+    async def mock_get_pg_pool():
+        return mock_pg_conn
+
     app.dependency_overrides[get_pg] = mock_get_pg
+    app.dependency_overrides[get_pg_pool] = mock_get_pg_pool
     app.dependency_overrides[get_neo4j_session] = mock_get_neo4j
 
     yield mock_neo4j_session
@@ -0,0 +1,78 @@
+"""Tests for settings parsing helpers."""
+
+import re
+import sys
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from backend.app.config import FROZEN_SETTINGS_ENV, Settings, freeze_settings, get_settings
+
+
+class TestCorsOrigins:
+    """CORS_ORIGINS splits into exact origins and a wildcard regex."""
+
+    def test_csv_env_value_is_split(self, monkeypatch):
+        monkeypatch.setenv("CORS_ORIGINS", "http://a.test, http://b.test,")
+        assert Settings().CORS_ORIGINS == ["http://a.test", "http://b.test"]
+
+    def test_exact_origins_are_a_frozenset(self):
+        settings = Settings(CORS_ORIGINS="http://a.test, http://b.test")
+        assert settings.cors_origins == frozenset({"http://a.test", "http://b.test"})
+        assert settings.cors_origin_regex is None
+
+    def test_wildcard_origins_become_regex(self):
+        settings = Settings(CORS_ORIGINS="http://a.test,https://*.example.com")
+        assert settings.cors_origins == frozenset({"http://a.test"})
+        pattern = re.compile(settings.cors_origin_regex)
+        assert pattern.fullmatch("https://app.example.com")
+        assert not pattern.fullmatch("https://app.example.com.evil.test")
+        assert not pattern.fullmatch("http://app.example.com")
+
+    def test_bare_star_allows_all(self):
+        settings = Settings(CORS_ORIGINS="*")
+        assert settings.cors_origins == frozenset({"*"})
+        assert settings.cors_origin_regex is None
+
+
+class TestPoolSizing:
+    """Pool bounds are configurable and must be ordered."""
+
+    def test_env_overrides(self, monkeypatch):
+        monkeypatch.setenv("PG_POOL_MIN_SIZE", "8")
+        monkeypatch.setenv("PG_POOL_MAX_SIZE", "48")
+        settings = Settings()
+        assert (settings.PG_POOL_MIN_SIZE, settings.PG_POOL_MAX_SIZE) == (8, 48)
+
+    def test_max_below_min_rejected(self):
+        with pytest.raises(ValidationError):
+            Settings(PG_POOL_MIN_SIZE=10, PG_POOL_MAX_SIZE=5)
+
+
+class TestFreezeSettings:
+    """freeze_settings writes a module that rebuilds the same settings."""
+
+    def test_round_trip(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PAGE_MAX", "123")
+        target = freeze_settings(tmp_path / "config_cache.py")
+
+        namespace: dict = {}
+        source = target.read_text().replace("from .config import", "from backend.app.config import")
+        exec(compile(source, str(target), "exec"), namespace)
+
+        frozen = namespace["SETTINGS_FROZEN"]
+        assert isinstance(frozen, Settings)
+        assert frozen.model_dump() == Settings().model_dump()
+        assert frozen.PAGE_MAX == 123
+
+    def test_frozen_module_requires_opt_in(self, monkeypatch):
+        frozen = Settings.model_construct(PAGE_MAX=7)
+        monkeypatch.setitem(
+            sys.modules, "backend.app.config_cache", SimpleNamespace(SETTINGS_FROZEN=frozen)
+        )
+        monkeypatch.delenv(FROZEN_SETTINGS_ENV, raising=False)
+        # __wrapped__ bypasses the lru_cache so the app's instance is untouched
+        assert get_settings.__wrapped__() is not frozen
+        monkeypatch.setenv(FROZEN_SETTINGS_ENV, "1")
+        assert get_settings.__wrapped__() is frozen
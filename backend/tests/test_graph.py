@@ -111,3 +111,22 @@ class TestGraphEndpoints:
         assert response.status_code == 400
         assert response.json()["detail"] == "invalid verse identifier"
         mock_session.run.assert_not_called()
+
+    def test_repeat_lookup_served_from_cache(
+        self,
+        client: TestClient,
+        override_db_dependencies,
+        sample_neighborhood: List[dict],
+    ) -> None:
+        mock_session = override_db_dependencies
+        result = AsyncMock()
+        result.data = AsyncMock(return_value=sample_neighborhood)
+        mock_session.run.return_value = result
+        mock_session.run.reset_mock()
+
+        first = client.get("/v1/graph/verse/43:3:16:")
+        second = client.get("/v1/graph/parallel/ESV/43:3:16")
+
+        assert first.status_code == second.status_code == 200
+        assert second.json() == first.json()
+        mock_session.run.assert_called_once()
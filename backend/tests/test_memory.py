@@ -4,16 +4,60 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from typing import Any, Dict, List
+from unittest.mock import AsyncMock
 
 import pytest
 
+from backend.app.dependencies.redis import get_redis
+from backend.app.main import app
+from backend.app.models import SessionMessage, SessionMessageAppendRequest
+from backend.app.services.memory import SessionMemoryService
 from backend.tests.conftest import create_mock_record
 
 
+class _FakeRedis:
+    """In-memory stand-in for the hash commands behind the session counter."""
+
+    def __init__(self) -> None:
+        self.hashes: Dict[str, Dict[str, int]] = {}
+
+    async def hmget(self, key: str, *fields: str) -> List[Any]:
+        data = self.hashes.get(key, {})
+        return [str(data[field]).encode() if field in data else None for field in fields]
+
+    def pipeline(self, transaction: bool = True) -> "_FakeRedis":
+        return self
+
+    async def __aenter__(self) -> "_FakeRedis":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    def hincrby(self, key: str, field: str, amount: int) -> None:
+        data = self.hashes.setdefault(key, {})
+        data[field] = data.get(field, 0) + amount
+
+    def hset(self, key: str, mapping: Dict[str, int]) -> None:
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    def hdel(self, key: str, *fields: str) -> None:
+        for field in fields:
+            self.hashes.get(key, {}).pop(field, None)
+
+    def expire(self, key: str, seconds: int) -> None:
+        return None
+
+    async def execute(self) -> List[Any]:
+        return []
+
+
 @pytest.mark.asyncio
 async def test_session_memory_crud(async_client, mock_pg_conn):
     """Exercise session memory CRUD endpoints with mocked persistence."""
 
+    redis = _FakeRedis()
+    app.dependency_overrides[get_redis] = lambda: redis
     session_id = "session-unit"
     messages: List[Dict[str, Any]] = []
     citations: List[Dict[str, Any]] = []
@@ -80,7 +124,7 @@ async def test_session_memory_crud(async_client, mock_pg_conn):
             offset = args[2]
             rows = [m for m in messages if m["session_id"] == args[0]]
             slice_rows = rows[offset: offset + limit]
-            return [create_mock_record(row) for row in slice_rows]
+            return [create_mock_record({**row, "total": len(rows)}) for row in slice_rows]
         if "FROM SESSION_CITATION" in sql:
             if "ANY($1::BIGINT[])" in sql:
                 message_ids = set(args[0])
@@ -146,6 +190,16 @@ async def test_session_memory_crud(async_client, mock_pg_conn):
     body = list_response.json()
     assert body["total"] == 1
     assert body["items"][0]["message_id"] == message_id
+    # The total rides on the page query; no separate COUNT round-trip
+    assert mock_pg_conn.fetchval.call_count == 0
+
+    # Paging past the cached total answers without touching Postgres
+    fetches = mock_pg_conn.fetch.call_count
+    past_end = await async_client.get(f"/v1/sessions/{session_id}/messages?limit=10&offset=10")
+    assert past_end.status_code == 200
+    assert past_end.json()["total"] == 1
+    assert past_end.json()["items"] == []
+    assert mock_pg_conn.fetch.call_count == fetches
 
     update_response = await async_client.patch(
         f"/v1/sessions/{session_id}/messages/{message_id}",
@@ -174,3 +228,63 @@ async def test_session_memory_crud(async_client, mock_pg_conn):
     clear_response = await async_client.delete(f"/v1/sessions/{session_id}/messages")
     assert clear_response.status_code == 200
     assert clear_response.json()["deleted"] == 0
+
+    # Writes adjust the counted total, so a stale total is never served
+    await async_client.post(
+        f"/v1/sessions/{session_id}/messages", json={"role": "user", "content": "Again"}
+    )
+    again = await async_client.get(f"/v1/sessions/{session_id}/messages?offset=1")
+    assert again.json()["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_session_count_ignores_total_raced_by_append(mock_pg_conn):
+    """An append landing between the Postgres read and the counter store wins."""
+
+    session_id = "session-race"
+    service = SessionMemoryService(mock_pg_conn, redis=_FakeRedis(), count_ttl=5)
+    stored: List[SessionMessage] = []
+
+    async def insert_message(*, session_id, role, content, metadata):
+        message = SessionMessage(
+            message_id=len(stored) + 1,
+            session_id=session_id,
+            role=role,
+            content=content,
+            metadata=metadata,
+            created_at=datetime.now(timezone.utc),
+        )
+        stored.append(message)
+        return message
+
+    async def list_messages(session_id, *, limit, offset):
+        page, total = stored[offset : offset + limit], len(stored)
+        if total == 1:
+            # Another request appends after the total was read
+            await service.append_message(
+                session_id, SessionMessageAppendRequest(role="user", content="late")
+            )
+        return page, total
+
+    repo = AsyncMock()
+    repo.insert_message.side_effect = insert_message
+    repo.add_citations.return_value = []
+    repo.list_messages.side_effect = list_messages
+    service._repo = repo
+
+    await service.append_message(
+        session_id, SessionMessageAppendRequest(role="user", content="first")
+    )
+    raced = await service.list_session_context(session_id, limit=10, offset=0)
+    assert raced.total == 1
+
+    # The stale total of 1 was not stored, so the new message is still served
+    polled = await service.list_session_context(session_id, limit=10, offset=1)
+    assert polled.total == 2
+    assert [item.content for item in polled.items] == ["late"]
+
+    await service.append_message(
+        session_id, SessionMessageAppendRequest(role="user", content="third")
+    )
+    polled = await service.list_session_context(session_id, limit=10, offset=2)
+    assert [item.content for item in polled.items] == ["third"]
@@ -0,0 +1,242 @@
+"""Unit tests for request/response model validation."""
+
+import base64
+from array import array
+
+import pytest
+from pydantic import ValidationError
+
+from backend.app import models
+from backend.app.models import (
+    AssetCreate,
+    AssetEmbeddingRequest,
+    AssetSearchRequest,
+    AssetUpdate,
+    BatchVerseRequest,
+    Book,
+    ChunkSearchQuery,
+    EmbeddingLookupRequest,
+    EmbeddingVector,
+    FTSQuery,
+    HybridQuery,
+    SearchHit,
+    SessionCitationCreate,
+    SessionMessageAppendRequest,
+    SessionMessageUpdate,
+    VectorQuery,
+)
+from backend.app.schemas.users import RegistrationRequest
+
+
+def _packed(values, dim=768) -> str:
+    return base64.b64encode(array("f", values * dim).tobytes()).decode("ascii")
+
+
+class TestEmbeddingDecoding:
+    """Embeddings may be sent as JSON arrays or base64 float32 payloads."""
+
+    def test_vector_query_accepts_base64_float32(self):
+        query = VectorQuery(embedding=_packed([0.25]))
+        assert len(query.embedding) == 768
+        assert query.embedding[0] == pytest.approx(0.25)
+
+    def test_hybrid_query_accepts_base64_float32(self):
+        query = HybridQuery(q="love", embedding=_packed([0.5]))
+        assert len(query.embedding) == 768
+
+    def test_list_embedding_still_supported(self):
+        query = VectorQuery(embedding=[0.1] * 768)
+        assert query.embedding[0] == pytest.approx(0.1)
+
+    def test_invalid_base64_rejected(self):
+        with pytest.raises(ValidationError):
+            VectorQuery(embedding="not base64!")
+
+    def test_truncated_float32_payload_rejected(self):
+        payload = base64.b64encode(b"\x00" * 6).decode("ascii")
+        with pytest.raises(ValidationError):
+            VectorQuery(embedding=payload, dim=1)
+
+    def test_decoded_length_checked_against_dim(self):
+        with pytest.raises(ValidationError):
+            VectorQuery(embedding=_packed([0.5], dim=10), dim=768)
+
+    @pytest.mark.parametrize("embedding", [[0.5] * 10, _packed([0.5], dim=10)])
+    def test_length_mismatch_rejected_before_field_validation(self, embedding):
+        with pytest.raises(ValidationError) as exc:
+            VectorQuery(embedding=embedding, dim=768)
+        assert exc.value.errors()[0]["loc"] == ()
+
+    @pytest.mark.parametrize("dim", ["768", 768.0])
+    @pytest.mark.parametrize("model", [VectorQuery, AssetSearchRequest])
+    def test_non_int_dim_still_checked(self, model, dim):
+        with pytest.raises(ValidationError):
+            model(embedding=[0.0] * 10, dim=dim)
+        assert model(embedding=[0.0] * 768, dim=dim).dim == 768
+
+    def test_asset_search_checks_length_against_dim(self):
+        with pytest.raises(ValidationError):
+            AssetSearchRequest(embedding=[0.5] * 10, dim=768)
+
+    def test_chunk_query_dim_bounds_apply_to_packed_payloads(self):
+        with pytest.raises(ValidationError):
+            ChunkSearchQuery(embedding=_packed([0.5], dim=16), dim=16)
+
+    @pytest.mark.parametrize("embedding", [[0.5] * 10, _packed([0.5], dim=10)])
+    def test_chunk_query_length_bounds_apply_to_packed_payloads(self, embedding):
+        with pytest.raises(ValidationError):
+            ChunkSearchQuery(embedding=embedding, dim="1024")
+
+    def test_chunk_query_uses_declared_dim(self):
+        query = ChunkSearchQuery(embedding=_packed([0.5], dim=1024), dim=1024)
+        assert len(query.embedding) == 1024
+
+    @pytest.mark.parametrize(
+        "model, extra",
+        [
+            (ChunkSearchQuery, {}),
+            (AssetSearchRequest, {}),
+            (AssetEmbeddingRequest, {}),
+            (EmbeddingVector, {"verse_id": "KJV_1_1_1_", "embedding_model": "m", "embedding_dim": 768}),
+        ],
+    )
+    def test_all_embedding_models_accept_base64(self, model, extra):
+        instance = model(embedding=_packed([0.5]), **extra)
+        assert len(instance.embedding) == 768
+
+
+class TestFTSQuery:
+    """Full-text queries are trimmed and must not be blank."""
+
+    def test_strips_surrounding_whitespace(self):
+        assert FTSQuery(q="  in the beginning ").q == "in the beginning"
+
+    @pytest.mark.parametrize("q", ["", "   ", "\t\n"])
+    def test_rejects_blank_query(self, q):
+        with pytest.raises(ValidationError):
+            FTSQuery(q=q)
+
+
+class TestSearchHit:
+    """Hit models are immutable; score updates go through model_copy."""
+
+    def test_rejects_assignment(self):
+        hit = SearchHit(verse_id="KJV_1_1_1_", text="In the beginning", score=0.5)
+        with pytest.raises(ValidationError):
+            hit.score = 1.0
+
+    def test_model_copy_update(self):
+        hit = SearchHit.model_construct(verse_id="KJV_1_1_1_", text="t", score=0.5)
+        boosted = hit.model_copy(update={"score": 0.75})
+        assert (hit.score, boosted.score) == (0.5, 0.75)
+
+
+class TestBookTestament:
+    """Testament is an int enum internally and "Old"/"New" on the wire."""
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [("Old", models.Testament.OLD), ("New", models.Testament.NEW), (2, models.Testament.NEW)],
+    )
+    def test_accepts_names_and_ints(self, raw, expected):
+        book = Book(translation_code="KJV", book_number=1, name="Genesis", testament=raw)
+        assert book.testament is expected
+
+    def test_serialises_as_name(self):
+        book = Book(translation_code="KJV", book_number=40, name="Matthew", testament="New")
+        assert book.model_dump(mode="json")["testament"] == "New"
+
+    def test_rejects_unknown(self):
+        with pytest.raises(ValidationError):
+            Book(translation_code="KJV", book_number=1, name="Genesis", testament="Middle")
+
+
+class TestSessionText:
+    """Session text fields reject blank input and keep the value verbatim."""
+
+    def test_content_kept_verbatim(self):
+        message = SessionMessageAppendRequest(role="user", content="  indented\n")
+        assert message.content == "  indented\n"
+
+    @pytest.mark.parametrize("content", ["", "  ", "\n\t"])
+    def test_blank_content_rejected(self, content):
+        with pytest.raises(ValidationError):
+            SessionMessageAppendRequest(role="user", content=content)
+        with pytest.raises(ValidationError):
+            SessionMessageUpdate(content=content)
+
+    def test_update_content_optional(self):
+        assert SessionMessageUpdate().content is None
+
+    def test_metadata_passed_through(self):
+        metadata = {"tool": {"args": [1, 2]}}
+        message = SessionMessageAppendRequest(role="tool", content="ok", metadata=metadata)
+        assert message.metadata is metadata
+
+    def test_metadata_must_be_object(self):
+        with pytest.raises(ValidationError):
+            SessionMessageAppendRequest(role="tool", content="ok", metadata=["not", "an", "object"])
+
+    def test_blank_citation_source_rejected(self):
+        with pytest.raises(ValidationError):
+            SessionCitationCreate(source_type="verse", source_id=" ")
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["Rendition", "GraphExpansion", "GraphExpansionInfo", "FusionInfo", "RetrievalHit", "RetrievalResponse"],
+)
+def test_retrieval_models_built_at_import(name):
+    """The /retrieval response models must not rebuild lazily on first request."""
+    model = getattr(models, name)
+    assert model.__pydantic_complete__
+    assert not model.model_config.get("defer_build", False)
+
+
+class TestBatchVerseRequest:
+    """Batch verse ID lists keep their bounds with the fast path enabled."""
+
+    def test_accepts_list_of_strings(self):
+        request = BatchVerseRequest(verse_ids=["KJV_1_1_1_", "KJV_1_1_2_"])
+        assert request.verse_ids == ["KJV_1_1_1_", "KJV_1_1_2_"]
+
+    def test_rejects_empty_list(self):
+        with pytest.raises(ValidationError):
+            BatchVerseRequest(verse_ids=[])
+
+    def test_rejects_oversized_list(self):
+        with pytest.raises(ValidationError):
+            BatchVerseRequest(verse_ids=["KJV_1_1_1_"] * 501)
+
+    def test_rejects_non_string_items(self):
+        with pytest.raises(ValidationError):
+            BatchVerseRequest(verse_ids=["KJV_1_1_1_", 3])
+
+    def test_embedding_lookup_shares_bounds(self):
+        assert EmbeddingLookupRequest(verse_ids=["KJV_1_1_1_"]).verse_ids == ["KJV_1_1_1_"]
+        with pytest.raises(ValidationError):
+            EmbeddingLookupRequest(verse_ids=["KJV_1_1_1_"] * 501)
+
+
+class TestAssetUpdate:
+    """AssetUpdate is derived from AssetCreate with every field optional."""
+
+    def test_fields_mirror_asset_create(self):
+        assert list(AssetUpdate.model_fields) == list(AssetCreate.model_fields)
+
+    def test_all_fields_optional(self):
+        update = AssetUpdate(title="Creation")
+        assert update.model_dump(exclude_unset=True) == {"title": "Creation"}
+
+
+class TestRegistrationEmail:
+    """Registration emails need a local part, one "@" and a dotted domain."""
+
+    def test_accepts_plain_address(self):
+        request = RegistrationRequest(email="user@example.com", password="x" * 8, display_name="Al")
+        assert request.email == "user@example.com"
+
+    @pytest.mark.parametrize("email", ["user@localhost", "@example.com", "a b@example.com", "a@@b.com"])
+    def test_rejects_malformed(self, email):
+        with pytest.raises(ValidationError):
+            RegistrationRequest(email=email, password="x" * 8, display_name="Al")
@@ -0,0 +1,27 @@
+"""Tests for asyncpg connection initialisation."""
+
+from unittest.mock import AsyncMock
+
+import orjson
+import pytest
+
+from backend.app.db.postgres_async import _encode_json, _init_conn
+
+
+@pytest.mark.asyncio
+async def test_init_conn_registers_json_codecs():
+    conn = AsyncMock()
+    await _init_conn(conn)
+
+    registered = {call.args[0]: call.kwargs for call in conn.set_type_codec.await_args_list}
+    assert set(registered) == {"json", "jsonb"}
+    for kwargs in registered.values():
+        assert kwargs["schema"] == "pg_catalog"
+        assert kwargs["decoder"] is orjson.loads
+
+
+def test_encode_json_round_trip():
+    value = {"tool": {"args": [1, 2.5, None]}, "name": "é"}
+    encoded = _encode_json(value)
+    assert isinstance(encoded, str)
+    assert orjson.loads(encoded) == value
@@ -409,3 +409,14 @@ class TestSearchEdgeCases:
 
         # Should handle gracefully
         assert response.status_code in [200, 400]
+
+    def test_search_malformed_json_body(self, client: TestClient):
+        """Should reject a body that is not valid JSON with 422."""
+        response = client.post(
+            "/v1/search/fts",
+            content=b'{"q": "beginning", ',
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "json_invalid"
@@ -1,8 +1,15 @@
 """Tests for stats and monitoring endpoints."""
 
+import asyncio
+from datetime import datetime, timezone
+
 import pytest
 from fastapi.testclient import TestClient
 
+from backend.app.routers.analytics import analytics_window
+from backend.app.services.analytics import AnalyticsService
+from backend.app.utils.cache import CacheManager
+
 
 class TestEmbeddingStats:
     """Tests for embedding coverage statistics."""
@@ -35,3 +42,92 @@ class TestAnalytics:
         if response.status_code == 200:
             data = response.json()
             assert "window_start" in data or "query_counts" in data
+
+
+class _Pool:
+    """Stand-in pool recording query concurrency and volume."""
+
+    def __init__(self):
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def _query(self, result):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return result
+
+    async def fetch(self, *args):
+        return await self._query([])
+
+    async def fetchrow(self, *args):
+        return await self._query(None)
+
+
+class TestAnalyticsService:
+    """Overview aggregations run concurrently and are memoised per window."""
+
+    @pytest.mark.asyncio
+    async def test_overview_queries_overlap(self):
+        pool = _Pool()
+        overview = await AnalyticsService(pool).overview()
+        assert overview.query_counts.total == 0
+        assert pool.peak == 6
+
+    @pytest.mark.asyncio
+    async def test_repeated_window_served_from_cache(self):
+        pool = _Pool()
+        cache = CacheManager(redis_url="", default_ttl=60, max_items=16, namespace="test")
+        service = AnalyticsService(pool, cache=cache, cache_ttl=60)
+
+        window = {
+            "start": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "end": datetime(2024, 1, 8, tzinfo=timezone.utc),
+        }
+        first = await service.counts(**window)
+        calls = pool.calls
+        second = await service.counts(**window)
+
+        assert second is first
+        assert pool.calls == calls
+
+
+class TestAnalyticsWindow:
+    """Analytics routes accept epoch-second window bounds."""
+
+    def test_epoch_bounds_override_iso(self):
+        window = analytics_window(
+            start=datetime(2000, 1, 1, tzinfo=timezone.utc),
+            end=None,
+            start_ts=1704067200,
+            end_ts=None,
+        )
+        assert window.start == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert window.end is None
+
+    def test_out_of_range_epoch_rejected(self, client: TestClient, override_db_dependencies):
+        response = client.get("/v1/analytics/counts?start_ts=99999999999999999")
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_cached_result_reports_its_own_window(self):
+        pool = _Pool()
+        cache = CacheManager(redis_url="", default_ttl=60, max_items=16, namespace="test")
+        service = AnalyticsService(pool, cache=cache, cache_ttl=60)
+
+        # Two explicit windows a second apart must not share an entry
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 8, 0, 0, 1, tzinfo=timezone.utc)
+        first = await service.overview(start=start, end=end)
+        second = await service.overview(start=start, end=end.replace(second=2))
+
+        assert first.window_end.second == 1
+        assert second.window_end.second == 2
+
+        rolling = await service.overview()
+        calls = pool.calls
+        assert await service.overview() is rolling
+        assert pool.calls == calls
@@ -172,9 +172,9 @@ class Manifest(BaseModel):
 # Utilities
 # ---------------------------
 def load_manifest(path: Path) -> Manifest:
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    return Manifest.model_validate(data)
+    # Parse and validate in one pass in pydantic-core, reusing the validator
+    # built once for the Manifest class; no intermediate dict.
+    return Manifest.model_validate_json(path.read_bytes())
 
 
 def sha256_file(path: Path) -> str:
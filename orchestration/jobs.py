@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dagster import graph
+from dagster import graph, in_process_executor
 
 from .ops import (
     embedding_generation_op,
@@ -11,13 +11,19 @@ from .ops import (
     pgvector_index_build_op,
 )
 
+# Ops hand the manifest payload along in memory (``mem_io_manager``), which
+# requires every step of a run to execute in one process. The graphs are
+# linear chains, so the in-process executor gives up no parallelism.
+
 
 @graph(description="Validate the manifest.json payload")
 def manifest_validation_graph():
     manifest_validation_op()
 
 
-manifest_validation_job = manifest_validation_graph.to_job(name="manifest_validation_job")
+manifest_validation_job = manifest_validation_graph.to_job(
+    name="manifest_validation_job", executor_def=in_process_executor
+)
 
 
 @graph(description="Validate manifest and trigger embedding generation")
@@ -26,7 +32,9 @@ def embedding_generation_graph():
     embedding_generation_op(manifest)
 
 
-embedding_generation_job = embedding_generation_graph.to_job(name="embedding_generation_job")
+embedding_generation_job = embedding_generation_graph.to_job(
+    name="embedding_generation_job", executor_def=in_process_executor
+)
 
 
 @graph(description="Generate embeddings and build pgvector indexes")
@@ -36,7 +44,9 @@ def pgvector_index_graph():
     pgvector_index_build_op(embedded_manifest)
 
 
-pgvector_index_job = pgvector_index_graph.to_job(name="pgvector_index_job")
+pgvector_index_job = pgvector_index_graph.to_job(
+    name="pgvector_index_job", executor_def=in_process_executor
+)
 
 
 @graph(description="Validate manifest and seed Neo4j metadata")
@@ -45,7 +55,9 @@ def neo4j_seeding_graph():
     neo4j_seeding_op(manifest)
 
 
-neo4j_seeding_job = neo4j_seeding_graph.to_job(name="neo4j_seeding_job")
+neo4j_seeding_job = neo4j_seeding_graph.to_job(
+    name="neo4j_seeding_job", executor_def=in_process_executor
+)
 
 
 @graph(description="End-to-end data refresh across validation, embeddings, indexes, and graph")
@@ -56,4 +68,6 @@ def full_data_refresh_graph():
     neo4j_seeding_op(indexed_manifest)
 
 
-full_data_refresh_job = full_data_refresh_graph.to_job(name="full_data_refresh_job")
+full_data_refresh_job = full_data_refresh_graph.to_job(
+    name="full_data_refresh_job", executor_def=in_process_executor
+)
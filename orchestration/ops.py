@@ -15,7 +15,11 @@ DEFAULT_RETRY_POLICY = RetryPolicy(max_retries=3, delay=timedelta(minutes=5))
 @op(
     required_resource_keys={"manifest_service"},
     retry_policy=DEFAULT_RETRY_POLICY,
-    out=Out(dict, description="Validated manifest payload"),
+    out=Out(
+        dict,
+        description="Validated manifest payload",
+        io_manager_key="mem_io_manager",
+    ),
 )
 def manifest_validation_op(context: OpExecutionContext) -> Dict[str, object]:
     """Validate the manifest.json file and emit the manifest payload."""
@@ -41,7 +45,11 @@ def manifest_validation_op(context: OpExecutionContext) -> Dict[str, object]:
     required_resource_keys={"embedding_service"},
     retry_policy=DEFAULT_RETRY_POLICY,
     ins={"manifest_payload": In(dict)},
-    out=Out(dict, description="Manifest payload propagated to downstream ops"),
+    out=Out(
+        dict,
+        description="Manifest payload propagated to downstream ops",
+        io_manager_key="mem_io_manager",
+    ),
 )
 def embedding_generation_op(
     context: OpExecutionContext, manifest_payload: Dict[str, object]
@@ -57,7 +65,11 @@ def embedding_generation_op(
     required_resource_keys={"postgres"},
     retry_policy=DEFAULT_RETRY_POLICY,
     ins={"manifest_payload": In(dict)},
-    out=Out(dict, description="Manifest payload propagated to graph seeding"),
+    out=Out(
+        dict,
+        description="Manifest payload propagated to graph seeding",
+        io_manager_key="mem_io_manager",
+    ),
 )
 def pgvector_index_build_op(
     context: OpExecutionContext, manifest_payload: Dict[str, object]
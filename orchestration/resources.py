@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Mapping, Optional
 
-from dagster import ConfigurableResource, InitResourceContext
+from dagster import ConfigurableResource, InitResourceContext, mem_io_manager
 
 from backend.validation import (
     ManifestMetadata,
@@ -197,4 +197,7 @@ def build_resource_instances(context: Optional[InitResourceContext] = None) -> D
         "embedding_service": EmbeddingServiceResource(),
         "postgres": PostgresResource(),
         "neo4j": Neo4jResource(),
+        # Keeps the manifest payload in memory between ops instead of
+        # pickling it to the filesystem storage at every hop
+        "mem_io_manager": mem_io_manager,
     }